@@ -105,6 +105,9 @@ for i in $(seq 0 $((server_count - 1))); do
     # Extract stargazer_count from GitHub data
     stargazer_count=$(echo "$server" | jq -r '._meta."io.modelcontextprotocol.registry/publisher-provided".github.stargazer_count // empty')
     
+    # Extract the registry's last update time (used by `mcp list --sort updated`)
+    updated_at=$(echo "$server" | jq -r '._meta."io.modelcontextprotocol.registry/official".updated_at // empty')
+    
     # Extract organization/author from server name (e.g., "microsoft/markitdown" -> "Microsoft")
     by_organization=""
     if [[ "$name" == *"/"* ]]; then
@@ -264,6 +267,11 @@ for i in $(seq 0 $((server_count - 1))); do
         mcp_object=$(echo "$mcp_object" | jq --argjson stars "$stargazer_count" '.stargazer_count = $stars')
     fi
     
+    # Add updated_at if available
+    if [ -n "$updated_at" ]; then
+        mcp_object=$(echo "$mcp_object" | jq --arg updated "$updated_at" '.updated_at = $updated')
+    fi
+    
     # Add by organization if available
     if [ -n "$by_organization" ]; then
         mcp_object=$(echo "$mcp_object" | jq --arg by "$by_organization" '.by = $by')
@@ -109,6 +109,16 @@ foreach ($server in $servers) {
         $stargazerCount = $server._meta.'io.modelcontextprotocol.registry/publisher-provided'.github.stargazer_count
     }
     
+    # Extract the registry's last update time (used by `mcp list --sort updated`)
+    $updatedAt = $null
+    if ($server._meta -and $server._meta.'io.modelcontextprotocol.registry/official' -and $server._meta.'io.modelcontextprotocol.registry/official'.updated_at) {
+        $updatedAt = $server._meta.'io.modelcontextprotocol.registry/official'.updated_at
+        # ConvertFrom-Json may turn timestamps into DateTime values; keep ISO 8601 strings
+        if ($updatedAt -is [datetime]) {
+            $updatedAt = $updatedAt.ToUniversalTime().ToString("yyyy-MM-ddTHH:mm:ssZ")
+        }
+    }
+    
     # Extract organization/author from server name (e.g., "microsoft/markitdown" -> "Microsoft")
     $byOrganization = $null
     if ($name -and $name.Contains("/")) {
@@ -246,6 +256,11 @@ foreach ($server in $servers) {
         $mcpObject["stargazer_count"] = $stargazerCount
     }
     
+    # Add updated_at if available
+    if ($updatedAt) {
+        $mcpObject["updated_at"] = $updatedAt
+    }
+    
     # Add by organization if available
     if ($byOrganization) {
         $mcpObject["by"] = $byOrganization
@@ -0,0 +1,251 @@
+"""Supported agents, their MCP configuration paths and installation checks."""
+
+from __future__ import annotations
+
+import platform
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+# Agent configuration with name, folder, install URL, and CLI tool requirement
+AGENT_CONFIG = {
+    "claude": {
+        "name": "Claude Code",
+        "folder": ".claude/",
+        "install_url": "https://www.claude.com/product/claude-code",
+        "requires_cli": False,
+    },
+    "continue": {
+        "name": "Continue",
+        "folder": ".continue/",
+        "install_url": None,  # IDE-based, no CLI check needed
+        "requires_cli": False,
+    },
+    "copilot": {
+        "name": "GitHub Copilot",
+        "folder": ".vscode/",
+        "install_url": None,  # IDE-based, no CLI check needed
+        "requires_cli": False,
+    },
+    "copilot-cli": {
+        "name": "Copilot CLI",
+        "folder": ".copilot/",
+        "install_url": "https://github.com/github/copilot-cli",
+        "requires_cli": True,
+    },
+    "cursor": {
+        "name": "Cursor",
+        "folder": ".cursor/",
+        "install_url": "https://cursor.sh",
+        "requires_cli": False,
+    },
+    "gemini": {
+        "name": "Gemini CLI",
+        "folder": ".gemini/",
+        "install_url": "https://github.com/google-gemini/gemini-cli",
+        "requires_cli": True,
+    },
+    "kiro": {
+        "name": "Kiro",
+        "folder": ".kiro/",
+        "install_url": "https://kiro.dev",
+        "requires_cli": False,
+    },
+    "lmstudio": {
+        "name": "LM Studio",
+        "folder": ".lmstudio/",
+        "install_url": "https://lmstudio.ai",
+        "requires_cli": False,
+    },
+    "qoder": {
+        "name": "Qoder",
+        "folder": ".qoder/",
+        "install_url": "https://qoder.com",
+        "requires_cli": False,
+    }
+}
+
+def get_mcp_config_path(agent: str = "copilot", project_path: Optional[Path] = None) -> Path:
+    """Get the MCP configuration path based on the agent and operating system.
+    
+    Args:
+        agent: The agent to configure (copilot, copilot-cli, continue, kiro, cursor, qoder, lmstudio, claude, gemini)
+        project_path: If provided, returns project-specific path instead of global path
+    """
+    if project_path:
+        # Project-specific paths
+        if agent == "copilot":
+            # VS Code project: .vscode/mcp.json
+            return project_path / ".vscode" / "mcp.json"
+        elif agent == "continue":
+            # Continue project: .continue/mcpServers/mcp.json
+            return project_path / ".continue" / "mcpServers" / "mcp.json"
+        elif agent == "kiro":
+            # Kiro project: .kiro/settings/mcp.json
+            return project_path / ".kiro" / "settings" / "mcp.json"
+        elif agent == "cursor":
+            # Cursor project: .cursor/mcp.json
+            return project_path / ".cursor" / "mcp.json"
+        elif agent == "claude":
+            # Claude project: .mcp.json (for Claude Agent) or .claude/mcp.json (for Claude Code)
+            return project_path / ".mcp.json"
+        elif agent == "gemini":
+            # Gemini project: .gemini/settings.json
+            return project_path / ".gemini" / "settings.json"
+        elif agent == "qoder":
+            # Qoder does not support project-level configuration, use global path
+            return get_mcp_config_path(agent)
+        elif agent == "lmstudio":
+            # LM Studio does not support project-level configuration, use global path
+            return get_mcp_config_path(agent)
+        elif agent == "copilot-cli":
+            # Copilot CLI does not support project-level configuration, use global path
+            return get_mcp_config_path(agent)
+    
+    # Global/user-level paths (existing functionality)
+    if agent == "continue": 
+        # Continue uses ~/.continue/mcpServers/mcp.json
+        return Path.home() / ".continue" / "mcpServers" / "mcp.json"
+    elif agent == "kiro":
+        # Kiro uses ~/.kiro/settings/mcp.json
+        return Path.home() / ".kiro" / "settings" / "mcp.json"
+    elif agent == "cursor":
+        # Cursor uses ~/.cursor/mcp.json
+        return Path.home() / ".cursor" / "mcp.json"
+    elif agent == "claude":
+        # Claude uses ~/.claude.json (for Claude Agent) or ~/.claude/mcp.json (for Claude Code)
+        return Path.home() / ".claude.json"
+    elif agent == "gemini":
+        # Gemini uses ~/.gemini/settings.json
+        return Path.home() / ".gemini" / "settings.json"
+    elif agent == "qoder":
+        # Qoder uses ~/AppData/Roaming/Qoder/SharedClientCache/mcp.json on Windows
+        system = platform.system().lower()
+        if system == "windows":
+            return Path.home() / "AppData" / "Roaming" / "Qoder" / "SharedClientCache" / "mcp.json"
+        else:
+            # For non-Windows systems, use a similar pattern in user config
+            return Path.home() / ".config" / "Qoder" / "SharedClientCache" / "mcp.json"
+    elif agent == "lmstudio":
+        # LM Studio uses ~/.lmstudio/mcp.json
+        return Path.home() / ".lmstudio" / "mcp.json"
+    elif agent == "copilot-cli":
+        # Copilot CLI uses ~/.copilot/mcp-config.json
+        return Path.home() / ".copilot" / "mcp-config.json"
+    
+    # Default to Copilot configuration path
+    system = platform.system().lower()
+    
+    if system == "windows":
+        # Windows: ~/AppData/Roaming/Code/User/mcp.json
+        return Path.home() / "AppData" / "Roaming" / "Code" / "User" / "mcp.json"
+    elif system == "linux":
+        # Linux: ~/.config/Code/User/mcp.json
+        return Path.home() / ".config" / "Code" / "User" / "mcp.json"
+    elif system == "darwin":
+        # macOS: ~/Library/Application Support/Code/User/mcp.json
+        return Path.home() / "Library" / "Application Support" / "Code" / "User" / "mcp.json"
+    else:
+        # Fallback to Linux path
+        return Path.home() / ".config" / "Code" / "User" / "mcp.json"
+
+def check_agent_installation(agent_key: str, agent_config: Dict[str, Any]) -> Dict[str, Any]:
+    """Check if an agent is installed on the system."""
+    import subprocess
+    
+    result = {
+        "agent": agent_key,
+        "name": agent_config["name"],
+        "installed": False,
+        "config_exists": False,
+        "config_path": None,
+        "cli_available": False,
+        "install_url": agent_config.get("install_url"),
+        "details": []
+    }
+    
+    # Check for configuration folder/file
+    try:
+        config_path = get_mcp_config_path(agent_key)
+        result["config_path"] = str(config_path)
+        
+        # Check if config file exists
+        if config_path.exists():
+            result["config_exists"] = True
+            result["details"].append(f"Config found: {config_path}")
+        else:
+            result["details"].append(f"Config not found: {config_path}")
+        
+        # Check if parent directory exists (indicates agent might be installed)
+        if agent_config["folder"]:
+            # Check global agent folder
+            agent_folder = Path.home() / agent_config["folder"]
+            if agent_folder.exists():
+                result["installed"] = True
+                result["details"].append(f"Agent folder found: {agent_folder}")
+            else:
+                result["details"].append(f"Agent folder not found: {agent_folder}")
+    except Exception as e:
+        result["details"].append(f"Error checking config: {str(e)}")
+    
+    # Check CLI availability if required
+    if agent_config.get("requires_cli", False):
+        try:
+            # Try to run the CLI command to check if it's available
+            cli_commands = {
+                # "claude": ["claude", "--version"], comment not working with electron
+                "gemini": ["gemini", "--version"],
+                "copilot-cli": ["copilot", "--version"],
+            }
+            
+            if agent_key in cli_commands:
+                try:
+                    # On Windows, some CLI tools might be PowerShell scripts
+                    # Try direct execution first, then PowerShell if that fails
+                    cmd = cli_commands[agent_key]
+                    
+                    try:
+                        result_cmd = subprocess.run(
+                            cmd, 
+                            capture_output=True, 
+                            text=True, 
+                            timeout=5
+                        )
+                        if result_cmd.returncode == 0:
+                            result["cli_available"] = True
+                            result["details"].append("CLI tool available")
+                        else:
+                            result["details"].append("CLI tool not available or not working")
+                    except FileNotFoundError:
+                        # If direct execution fails on Windows, try with PowerShell
+                        if platform.system().lower() == "windows":
+                            try:
+                                powershell_cmd = ["powershell", "-Command"] + cmd
+                                result_cmd = subprocess.run(
+                                    powershell_cmd,
+                                    capture_output=True,
+                                    text=True,
+                                    timeout=5
+                                )
+                                if result_cmd.returncode == 0:
+                                    result["cli_available"] = True
+                                    result["details"].append("CLI tool available (via PowerShell)")
+                                else:
+                                    result["details"].append("CLI tool not available or not working")
+                            except Exception:
+                                result["details"].append("CLI tool not found in PATH")
+                        else:
+                            result["details"].append("CLI tool not found in PATH")
+                            
+                except subprocess.TimeoutExpired:
+                    result["details"].append("CLI tool check timed out")
+        except Exception as e:
+            result["details"].append(f"Error checking CLI: {str(e)}")
+    else:
+        # For IDE-based agents, assume CLI is available if the agent folder exists
+        result["cli_available"] = result["installed"]
+    
+    # Overall installation status
+    if agent_config.get("requires_cli", False):
+        result["installed"] = result["cli_available"]
+    
+    return result
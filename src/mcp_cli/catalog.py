@@ -0,0 +1,724 @@
+"""Downloading, caching and merging the MCP server catalog."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import io
+import json
+import atexit
+import os
+import tempfile
+import threading
+import time
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, Optional, Tuple, List, Dict, Any, Callable
+
+from platformdirs import user_cache_dir
+
+from . import __version__
+from .console import console
+from .network import get_http_client, GITHUB_MAX_BACKOFF, github_rate_limit, _env_seconds, _github_auth_headers, _github_rate_limit_delay, _int_header, _is_github_url, _record_github_rate_limit
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+    import httpx
+
+CATALOG_MEMBER = "mcp_servers.json"  # Catalog file inside the release zip
+CATALOG_CACHE_FORMAT = 1
+CATALOG_CACHE_TTL = 6 * 60 * 60  # Seconds; override with MCP_GEARBOX_CACHE_TTL
+REFRESH_MODES = ("never", "background", "blocking")
+CATALOG_SOURCES = "github"  # Default for MCP_GEARBOX_CATALOG_SOURCES
+CATALOG_BUDGET = 15.0  # Seconds to wait for any catalog source; override with MCP_GEARBOX_CATALOG_BUDGET
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+DOWNLOAD_ATTEMPTS = 3  # Transfers interrupted mid-stream are resumed this many times
+REFRESH_EXIT_GRACE = 0.5  # Seconds exit waits for a background refresh; override with MCP_GEARBOX_REFRESH_GRACE
+REFRESH_FAILURE_BACKOFF = 30 * 60  # Seconds before a failed background refresh is retried
+
+# Size and throughput of the last catalog transfer in this process (exposed in --json output)
+catalog_download: Dict[str, Any] = {}
+
+def load_bundled_mcp_servers() -> Optional[List[Dict[str, Any]]]:
+    """Load the catalog snapshot packaged with this release, or None if it is missing."""
+    import importlib.resources
+    try:
+        snapshot = importlib.resources.files(__package__ or "mcp_cli") / "data" / "mcp_servers.json"
+        return json.loads(snapshot.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+def load_local_mcp_servers(quiet: bool = False) -> Optional[List[Dict[str, Any]]]:
+    """Load MCP servers from the bundled snapshot or a local template file as fallback."""
+    bundled = load_bundled_mcp_servers()
+    if bundled:
+        return bundled
+    
+    local_files = [
+        Path("templates/mcp-servers-sample.json"),
+        Path("templates/base_mcp.json"),
+        Path("mcp-servers-sample.json"),  # In case it's in root
+    ]
+    
+    for local_file in local_files:
+        if local_file.exists():
+            try:
+                with open(local_file, 'r') as f:
+                    return json.load(f)
+            except Exception as e:
+                if not quiet:
+                    console.print(f"[yellow]Warning: Could not load {local_file}: {e}[/yellow]")
+                continue
+    
+    # If no local files found, return a minimal default configuration
+    return [
+        {
+            "name": "Fetch",
+            "description": "A Model Context Protocol server providing tools to fetch and convert web content for usage by LLMs",
+            "mcp": {
+                "modelcontextprotocol/fetch": {
+                    "type": "stdio",
+                    "command": "uvx",
+                    "args": ["mcp-server-fetch"],
+                    "gallery": "https://github.com/modelcontextprotocol/servers/tree/main/src/fetch",
+                    "version": "0.6.3"
+                }
+            }
+        },
+        {
+            "name": "Filesystem", 
+            "description": "MCP server for filesystem access with read/write capabilities",
+            "mcp": {
+                "modelcontextprotocol/filesystem": {
+                    "type": "stdio",
+                    "command": "npx",
+                    "args": ["-y", "@modelcontextprotocol/server-filesystem"],
+                    "gallery": "https://github.com/modelcontextprotocol/servers/tree/main/src/filesystem",
+                    "version": "0.6.3"
+                }
+            }
+        },
+        {
+            "name": "Git",
+            "description": "A Model Context Protocol server providing tools to read, search, and manipulate Git repositories",
+            "mcp": {
+                "modelcontextprotocol/git": {
+                    "type": "stdio",
+                    "command": "uvx",
+                    "args": ["mcp-server-git"],
+                    "gallery": "https://github.com/modelcontextprotocol/servers/tree/main/src/git",
+                    "version": "0.6.2"
+                }
+            }
+        },
+        {
+            "name": "Markitdown",
+            "description": "Convert various file formats (PDF, Word, Excel, images, audio) to Markdown",
+            "mcp": {
+                "microsoft/markitdown": {
+                    "type": "stdio",
+                    "command": "uvx",
+                    "args": ["markitdown-mcp==0.0.1a4"],
+                    "gallery": "https://api.mcp.github.com/2025-09-15/v0/servers/976a2f68-e16c-4e2b-9709-7133487f8c14",
+                    "version": "1.0.0"
+                }
+            }
+        }
+    ]
+
+def get_catalog_cache_dir() -> Path:
+    """Get the versioned directory holding cached MCP server catalogs."""
+    return Path(user_cache_dir("mcp-gearbox", appauthor=False)) / "catalog" / f"v{CATALOG_CACHE_FORMAT}"
+
+def _catalog_cache_ttl() -> float:
+    """Return the catalog cache TTL in seconds (MCP_GEARBOX_CACHE_TTL overrides the default)."""
+    return _env_seconds("MCP_GEARBOX_CACHE_TTL", CATALOG_CACHE_TTL)
+
+def _write_json_atomic(path: Path, data: Any) -> None:
+    """Write JSON through a temporary file and rename it into place so readers never see a partial file."""
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(temp_path)
+        raise
+
+def load_catalog_cache(cache_key: str) -> Optional[Dict[str, Any]]:
+    """Load a cached catalog entry, returning None when it is missing or unreadable."""
+    cache_file = get_catalog_cache_dir() / f"{cache_key}.json"
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or not isinstance(entry.get("servers"), list):
+        return None
+    return entry
+
+def save_catalog_cache(cache_key: str, entry: Dict[str, Any]) -> None:
+    """Persist a catalog entry; failing to write the cache is never fatal."""
+    cache_dir = get_catalog_cache_dir()
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        _write_json_atomic(cache_dir / f"{cache_key}.json", entry)
+    except OSError:
+        pass
+
+def _read_catalog_zip(archive: Any) -> Optional[List[Dict[str, Any]]]:
+    """Parse the catalog member of a release zip without extracting anything to disk.
+
+    Args:
+        archive: Seekable binary file object holding the zip (in-memory buffer or open file)
+    """
+    with zipfile.ZipFile(archive) as zip_ref:
+        for info in zip_ref.infolist():
+            if PurePosixPath(info.filename).name == CATALOG_MEMBER:
+                with zip_ref.open(info) as f:
+                    return json.load(f)
+    return None
+
+def _network_metrics() -> Dict[str, Any]:
+    """Network details of this invocation, merged into --json output."""
+    return {
+        "github_rate_limit": dict(github_rate_limit) or None,
+        "catalog_download": dict(catalog_download) or None,
+    }
+
+def _partial_download_paths(cache_key: str, url: str) -> Tuple[Path, Path]:
+    """Get the paths of an interrupted download of url and of its metadata."""
+    partial_dir = get_catalog_cache_dir() / "partial"
+    name = f"{cache_key}-{hashlib.sha256(url.encode()).hexdigest()[:12]}"
+    return partial_dir / f"{name}.bin", partial_dir / f"{name}.json"
+
+def _load_partial_download(cache_key: str, url: str) -> Optional[Tuple[bytes, str]]:
+    """Load the bytes and If-Range validator of an interrupted download of url."""
+    data_path, meta_path = _partial_download_paths(cache_key, url)
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get("url") != url or not meta.get("validator"):
+            return None
+        return data_path.read_bytes(), meta["validator"]
+    except (OSError, ValueError):
+        return None
+
+def _save_partial_download(cache_key: str, url: str, data: bytes, validator: Optional[str]) -> None:
+    """Keep the bytes of an interrupted download so the next attempt can resume it."""
+    if not data or not validator:
+        return
+    data_path, meta_path = _partial_download_paths(cache_key, url)
+    try:
+        data_path.parent.mkdir(parents=True, exist_ok=True)
+        data_path.write_bytes(data)
+        _write_json_atomic(meta_path, {"url": url, "validator": validator})
+    except OSError:
+        pass
+
+def _discard_partial_download(cache_key: str, url: str) -> None:
+    """Remove the leftovers of an interrupted download of url."""
+    for path in _partial_download_paths(cache_key, url):
+        with contextlib.suppress(OSError):
+            path.unlink()
+
+def _range_validator(response: httpx.Response) -> Optional[str]:
+    """Return the validator to send in If-Range when resuming this response (strong ETag or Last-Modified)."""
+    etag = response.headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return response.headers.get("Last-Modified")
+
+def _fallback_mcp_servers(cached: Optional[Dict[str, Any]], quiet: bool = False) -> Optional[List[Dict[str, Any]]]:
+    """Serve a stale cached catalog when available, otherwise the local configuration."""
+    if cached:
+        if not quiet:
+            console.print("[yellow]Using cached MCP servers instead...[/yellow]")
+        return cached["servers"]
+    if not quiet:
+        console.print("[yellow]Falling back to local configuration...[/yellow]")
+    return load_local_mcp_servers(quiet)
+
+def _release_catalog_url(version: str) -> str:
+    """Get the download URL of the catalog zip attached to a GitHub release."""
+    return f"https://github.com/rohitsoni007/mcp-kit/releases/download/{version}/mcp-servers-{version}.zip"
+
+def get_catalog_sources(version: str) -> List[str]:
+    """Resolve the catalog sources (URLs or file paths) to query for a release.
+
+    MCP_GEARBOX_CATALOG_SOURCES is a comma-separated list where ``github``
+    stands for the GitHub release, and any other entry is an HTTP(S) mirror
+    or a filesystem path to a catalog zip or JSON file. ``{version}`` is
+    replaced with the release tag. The cached catalog is always the fallback.
+    """
+    spec = os.getenv("MCP_GEARBOX_CATALOG_SOURCES", "").strip() or CATALOG_SOURCES
+    sources = []
+    for item in spec.split(","):
+        item = item.strip()
+        if item == "github":
+            sources.append(_release_catalog_url(version))
+        elif item:
+            sources.append(item.replace("{version}", version))
+    return sources
+
+def _parse_catalog(data: Any) -> Optional[List[Dict[str, Any]]]:
+    """Parse a catalog from a zip archive or a plain JSON document (file object)."""
+    if data.read(4) == b"PK\x03\x04":
+        data.seek(0)
+        return _read_catalog_zip(data)
+    data.seek(0)
+    return json.load(data)
+
+def _is_valid_catalog(servers: Any) -> bool:
+    """Check that a source returned a usable catalog: a non-empty list of servers."""
+    return isinstance(servers, list) and bool(servers) and all(
+        isinstance(server, dict) and "name" in server and isinstance(server.get("mcp"), dict)
+        for server in servers
+    )
+
+def _fetch_catalog_entry(url: str, cache_key: str, cached: Optional[Dict[str, Any]], github_token: Optional[str] = None, progress: Optional[Callable[[str], None]] = None) -> Optional[Dict[str, Any]]:
+    """Fetch a catalog over HTTP, revalidating the cached copy when it came from the same URL.
+
+    Returns the cache entry to store (None when the archive holds no
+    catalog) without writing it, and never modifies ``cached``; network and
+    HTTP errors propagate to the caller. When the server rate limits the
+    request, the cached entry is returned with a backoff so no further
+    requests are made until the limit resets; without a cache the request is
+    retried once if the wait is at most GITHUB_MAX_BACKOFF seconds.
+
+    The archive is streamed in chunks. A transfer interrupted mid-stream is
+    resumed with an HTTP Range request, and if every attempt fails the bytes
+    received so far are kept in the cache directory for the next invocation.
+    ``progress`` receives a status line with the transfer size and speed.
+    """
+    import httpx
+    
+    # The token is only ever sent to GitHub, never to mirrors
+    headers = _github_auth_headers(github_token) if _is_github_url(url) else {}
+    # Range offsets and Content-Length count the bytes on the wire, so ask for
+    # them unencoded; the archive is compressed already
+    headers["Accept-Encoding"] = "identity"
+    
+    # Revalidate the cached copy instead of downloading it again
+    if cached and cached.get("url") == url:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    
+    archive = io.BytesIO()
+    validator = None
+    partial = _load_partial_download(cache_key, url)
+    if partial:
+        data, validator = partial
+        archive.write(data)
+    resumed_from = archive.tell()
+    started = time.monotonic()
+    rate_limit_retried = False
+    attempts = 0
+    
+    while True:
+        request_headers = dict(headers)
+        if archive.tell() and validator:
+            request_headers["Range"] = f"bytes={archive.tell()}-"
+            request_headers["If-Range"] = validator
+        received_before = archive.tell()
+        try:
+            # Stream the archive into memory and parse only the catalog member
+            with get_http_client().stream("GET", url, headers=request_headers) as response:
+                _record_github_rate_limit(response)
+                
+                delay = _github_rate_limit_delay(response)
+                if delay is not None:
+                    if cached:
+                        return {**cached, "backoff_until": time.time() + delay}
+                    if not rate_limit_retried and delay <= GITHUB_MAX_BACKOFF:
+                        rate_limit_retried = True
+                        time.sleep(delay)
+                        continue
+                
+                if response.status_code == 304 and cached:
+                    _discard_partial_download(cache_key, url)
+                    return {**cached, "fetched_at": time.time()}
+                if response.status_code == 416:
+                    # The saved bytes do not match the remote file; start over
+                    archive = io.BytesIO()
+                    validator = None
+                    resumed_from = 0
+                    continue
+                response.raise_for_status()
+                
+                if response.status_code != 206:
+                    # Full response: either a fresh download or the partial one went stale
+                    archive.seek(0)
+                    archive.truncate()
+                    resumed_from = 0
+                # A server that encodes anyway cannot be resumed from a decoded
+                # offset, and its Content-Length is not comparable to it either
+                encoded = response.headers.get("Content-Encoding", "identity").lower() != "identity"
+                validator = None if encoded else _range_validator(response)
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                length = _int_header(response, "Content-Length")
+                total = archive.tell() + length if length is not None and not encoded else None
+                
+                for chunk in response.iter_bytes(DOWNLOAD_CHUNK_SIZE):
+                    archive.write(chunk)
+                    if progress:
+                        elapsed = max(time.monotonic() - started, 1e-6)
+                        rate = (archive.tell() - resumed_from) / elapsed
+                        done = f"{archive.tell() // 1024} KiB" + (f" of {total // 1024} KiB" if total else "")
+                        progress(f"{done} at {rate / 1024:.0f} KiB/s")
+            break
+        except httpx.TransportError:
+            attempts += 1
+            # Only transfers that made progress are worth resuming
+            if archive.tell() > received_before and validator and attempts < DOWNLOAD_ATTEMPTS:
+                continue
+            _save_partial_download(cache_key, url, archive.getvalue(), validator)
+            raise
+    
+    elapsed = time.monotonic() - started
+    transferred = archive.tell() - resumed_from
+    catalog_download.update({
+        "url": url,
+        "bytes": archive.tell(),
+        "transferred_bytes": transferred,
+        "resumed_from": resumed_from,
+        "seconds": round(elapsed, 3),
+        "bytes_per_second": round(transferred / elapsed) if elapsed > 0 else None,
+    })
+    _discard_partial_download(cache_key, url)
+    
+    archive.seek(0)
+    servers = _parse_catalog(archive)
+    if not _is_valid_catalog(servers):
+        return None
+    
+    return {
+        "url": url,
+        "etag": etag,
+        "last_modified": last_modified,
+        "fetched_at": time.time(),
+        "servers": servers,
+    }
+
+def _fetch_catalog_url(url: str, cache_key: str, cached: Optional[Dict[str, Any]], github_token: Optional[str] = None, progress: Optional[Callable[[str], None]] = None) -> Optional[List[Dict[str, Any]]]:
+    """Fetch a catalog over HTTP (see _fetch_catalog_entry), store it under cache_key and return it."""
+    entry = _fetch_catalog_entry(url, cache_key, cached, github_token, progress)
+    if entry is None:
+        return None
+    save_catalog_cache(cache_key, entry)
+    return entry["servers"]
+
+def _read_catalog_file(path: Path) -> Optional[List[Dict[str, Any]]]:
+    """Read a catalog zip or JSON file from a local or shared filesystem path."""
+    with open(path, 'rb') as f:
+        servers = _parse_catalog(f)
+    if not _is_valid_catalog(servers):
+        return None
+    return servers
+
+def _read_catalog_entry(path: Path) -> Optional[Dict[str, Any]]:
+    """Read a catalog zip or JSON file into a cache entry, or None when it holds no catalog."""
+    servers = _read_catalog_file(path)
+    if servers is None:
+        return None
+    return {
+        "url": str(path),
+        "etag": None,
+        "last_modified": None,
+        "fetched_at": time.time(),
+        "servers": servers,
+    }
+
+def _run_in_daemon_thread(fn: Callable[..., Any], *args: Any, name: str = "mcp-worker", **kwargs: Any) -> Future:
+    """Run fn on a daemon thread and return a Future for its result.
+
+    Daemon threads never delay interpreter exit, so a hung request can be
+    abandoned once its result is no longer needed.
+    """
+    from concurrent.futures import Future
+    future: Future = Future()
+    
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+    
+    threading.Thread(target=run, name=name, daemon=True).start()
+    return future
+
+def _race_catalog_sources(version: str, cached: Optional[Dict[str, Any]], github_token: Optional[str] = None, progress: Optional[Callable[[str], None]] = None) -> Optional[List[Dict[str, Any]]]:
+    """Query every catalog source concurrently and return the first valid catalog.
+
+    Sources that are still running when a winner is found (or when the
+    MCP_GEARBOX_CATALOG_BUDGET latency budget runs out) are abandoned.
+    Sources only return cache entries, each revalidating its own copy of
+    ``cached``, and the winner's entry is the only one written, so a slower
+    source cannot replace it. Returns None when a source answered without a
+    catalog, and raises the last error (or TimeoutError) when no source
+    answered in time.
+    """
+    from concurrent.futures import FIRST_COMPLETED, wait
+    budget = _env_seconds("MCP_GEARBOX_CATALOG_BUDGET", CATALOG_BUDGET)
+    deadline = time.monotonic() + budget
+    
+    cache_key = f"release-{version}"
+    pending = set()
+    for source in get_catalog_sources(version):
+        if source.startswith(("http://", "https://")):
+            pending.add(_run_in_daemon_thread(_fetch_catalog_entry, source, cache_key, dict(cached) if cached else None, github_token, progress, name="mcp-catalog-source"))
+        else:
+            pending.add(_run_in_daemon_thread(_read_catalog_entry, Path(source).expanduser(), name="mcp-catalog-source"))
+    
+    last_error: Optional[BaseException] = None
+    answered = False
+    while pending:
+        done, pending = wait(pending, timeout=max(deadline - time.monotonic(), 0), return_when=FIRST_COMPLETED)
+        if not done:
+            raise TimeoutError(f"No catalog source answered within {budget:g}s")
+        for future in done:
+            try:
+                entry = future.result()
+            except Exception as e:
+                last_error = e
+                continue
+            if entry is not None:
+                save_catalog_cache(cache_key, entry)
+                return entry["servers"]
+            answered = True
+    if last_error and not answered:
+        raise last_error
+    return None
+
+_refresh_threads: List[threading.Thread] = []
+
+def _refresh_backoff_path(cache_key: str) -> Path:
+    """Get the small marker file holding the background refresh backoff of a catalog."""
+    return get_catalog_cache_dir() / f"{cache_key}.backoff.json"
+
+def _refresh_backoff_until(cache_key: str) -> float:
+    """Return until when background refreshes of a catalog are suspended (0 when one may run now)."""
+    try:
+        with open(_refresh_backoff_path(cache_key), 'r', encoding='utf-8') as f:
+            return float(json.load(f).get("backoff_until", 0))
+    except (OSError, ValueError, TypeError, AttributeError):
+        return 0.0
+
+def _refresh_in_background(cache_key: str, fetch: Callable[..., Any], *args: Any) -> None:
+    """Revalidate the catalog cached under cache_key on a worker thread for the next invocation.
+
+    The thread is a daemon: at exit the interpreter waits at most
+    MCP_GEARBOX_REFRESH_GRACE seconds for it and then abandons it. Before it
+    starts, a backoff of REFRESH_FAILURE_BACKOFF seconds is written to a
+    marker file next to the cache (the cached catalog itself is not rewritten),
+    so a refresh that fails or is abandoned keeps an unreachable source from
+    being contacted again on every run; a successful refresh removes the
+    marker. The cache file is replaced atomically, so a concurrent reader sees
+    either the old or the new catalog.
+    """
+    backoff_path = _refresh_backoff_path(cache_key)
+    try:
+        backoff_path.parent.mkdir(parents=True, exist_ok=True)
+        _write_json_atomic(backoff_path, {"backoff_until": time.time() + REFRESH_FAILURE_BACKOFF})
+    except OSError:
+        pass
+    
+    def refresh():
+        try:
+            servers = fetch(*args)
+        except Exception:
+            # The stale catalog has already been served; the backoff stays in place
+            return
+        if servers is not None:
+            with contextlib.suppress(OSError):
+                backoff_path.unlink()
+    
+    thread = threading.Thread(target=refresh, name="mcp-catalog-refresh", daemon=True)
+    _refresh_threads.append(thread)
+    thread.start()
+
+@atexit.register
+def _wait_for_background_refresh() -> None:
+    """Give background refreshes a short grace period to finish before the process exits."""
+    deadline = time.monotonic() + _env_seconds("MCP_GEARBOX_REFRESH_GRACE", REFRESH_EXIT_GRACE)
+    for thread in _refresh_threads:
+        thread.join(max(deadline - time.monotonic(), 0))
+
+def _is_cache_current(cached: Dict[str, Any], refresh: str) -> bool:
+    """Check whether a cached catalog can be served without contacting its source."""
+    now = time.time()
+    return (
+        refresh == "never"
+        or now - cached.get("fetched_at", 0) < _catalog_cache_ttl()
+        or now < cached.get("backoff_until", 0)
+    )
+
+def download_mcp_servers(version: str = None, refresh: str = "blocking", quiet: bool = False, github_token: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+    """Download MCP servers from GitHub release with fallback to local files.
+
+    All configured catalog sources (see get_catalog_sources) are raced and the
+    first valid answer wins. The parsed catalog is cached per release together
+    with its ETag and Last-Modified validators. Within the cache TTL (or while
+    GitHub asked us to back off) no request is made at all; after that the refresh mode
+    decides what happens:
+
+    - ``never``: serve the cache whatever its age (bundled snapshot without one)
+    - ``background``: serve the stale cache (or the bundled snapshot on a cold
+      start) now and revalidate it on a worker thread, unless a refresh in
+      the last REFRESH_FAILURE_BACKOFF seconds failed or was abandoned
+    - ``blocking``: revalidate with a conditional GET before returning
+
+    Requests are authenticated with ``github_token`` or GH_TOKEN/GITHUB_TOKEN
+    when set. With ``quiet`` no spinner or warnings are printed, so the
+    download can run while another thread owns the terminal.
+    """
+    if version is None:
+        version = f"v{__version__}"
+    
+    cached = load_catalog_cache(f"release-{version}")
+    if cached:
+        if _is_cache_current(cached, refresh):
+            return cached["servers"]
+        if refresh == "background":
+            if time.time() >= _refresh_backoff_until(f"release-{version}"):
+                _refresh_in_background(f"release-{version}", _race_catalog_sources, version, cached, github_token)
+            return cached["servers"]
+    elif refresh == "never":
+        return load_local_mcp_servers(quiet)
+    elif refresh == "background":
+        # Cold start: serve the bundled snapshot now and fetch a fresh catalog for the next run
+        bundled = load_bundled_mcp_servers()
+        if bundled:
+            if time.time() >= _refresh_backoff_until(f"release-{version}"):
+                _refresh_in_background(f"release-{version}", _race_catalog_sources, version, None, github_token)
+            return bundled
+    
+    import httpx
+    
+    status = contextlib.nullcontext() if quiet else console.status(f"[bold green]Downloading MCP servers {version}...")
+    try:
+        with status:
+            progress = None
+            if not quiet:
+                progress = lambda text: status.update(f"[bold green]Downloading MCP servers {version}... {text}")
+            servers = _race_catalog_sources(version, cached, github_token, progress)
+        if servers is None:
+            if not quiet:
+                console.print(f"[yellow]No valid {CATALOG_MEMBER} found in the downloaded package.[/yellow]")
+            return _fallback_mcp_servers(cached, quiet)
+        return servers
+                    
+    except httpx.HTTPStatusError as e:
+        if not quiet:
+            if _github_rate_limit_delay(e.response) is not None:
+                console.print("[yellow]GitHub rate limit reached. Set GH_TOKEN or GITHUB_TOKEN to raise the limit.[/yellow]")
+            else:
+                console.print(f"[yellow]Failed to download MCP servers: HTTP {e.response.status_code}[/yellow]")
+                console.print("[yellow]This is expected if the release doesn't exist yet.[/yellow]")
+        return _fallback_mcp_servers(cached, quiet)
+    except Exception as e:
+        if not quiet:
+            console.print(f"[yellow]Error downloading MCP servers: {str(e)}[/yellow]")
+        return _fallback_mcp_servers(cached, quiet)
+
+def load_catalog(source: str, refresh: str = "blocking", github_token: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Load a user-supplied catalog from a file path or URL.
+
+    URL catalogs are cached independently of the public catalog (keyed by
+    URL) and follow the same TTL, revalidation and refresh rules; if a URL
+    cannot be fetched its stale cached copy is used. Raises when no valid
+    catalog can be loaded.
+    """
+    if not source.startswith(("http://", "https://")):
+        servers = _read_catalog_file(Path(source).expanduser())
+        if servers is None:
+            raise ValueError(f"not a valid MCP server catalog: {source}")
+        return servers
+    
+    cache_key = f"catalog-{hashlib.sha256(source.encode()).hexdigest()[:16]}"
+    cached = load_catalog_cache(cache_key)
+    if cached:
+        if _is_cache_current(cached, refresh):
+            return cached["servers"]
+        if refresh == "background":
+            if time.time() >= _refresh_backoff_until(cache_key):
+                _refresh_in_background(cache_key, _fetch_catalog_url, source, cache_key, cached, github_token)
+            return cached["servers"]
+    
+    try:
+        servers = _fetch_catalog_url(source, cache_key, cached, github_token)
+    except Exception:
+        if cached:
+            return cached["servers"]
+        raise
+    if servers is None:
+        if cached:
+            return cached["servers"]
+        raise ValueError(f"not a valid MCP server catalog: {source}")
+    return servers
+
+def merge_catalogs(catalogs: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Merge catalogs by mcp key; entries from later catalogs take precedence.
+
+    An overriding entry takes the position of the entry it replaces and new
+    entries are appended in order, so the result is deterministic.
+    """
+    merged: List[Optional[Dict[str, Any]]] = []
+    positions: Dict[str, int] = {}
+    
+    for catalog in catalogs:
+        for server in catalog:
+            keys = list(server.get("mcp", {}).keys())
+            replaced = sorted({positions[key] for key in keys if key in positions})
+            for index in replaced:
+                for old_key in merged[index].get("mcp", {}):
+                    positions.pop(old_key, None)
+                merged[index] = None
+            if replaced:
+                index = replaced[0]
+                merged[index] = server
+            else:
+                index = len(merged)
+                merged.append(server)
+            for key in keys:
+                positions[key] = index
+    
+    return [server for server in merged if server is not None]
+
+def load_mcp_servers(catalogs: Optional[List[str]] = None, refresh: str = "blocking", quiet: bool = False, github_token: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+    """Load the public catalog merged with any user-supplied catalogs.
+
+    Extra catalogs (file paths or URLs) are loaded concurrently with the
+    public one and override it by mcp key, later ones taking precedence. A
+    catalog that cannot be loaded is reported and skipped.
+    """
+    futures = [
+        _run_in_daemon_thread(load_catalog, source, refresh, github_token, name="mcp-catalog-load")
+        for source in catalogs or []
+    ]
+    servers = download_mcp_servers(refresh=refresh, quiet=quiet, github_token=github_token)
+    if not futures:
+        return servers
+    
+    loaded = [servers or []]
+    for source, future in zip(catalogs, futures):
+        try:
+            loaded.append(future.result())
+        except Exception as e:
+            if not quiet:
+                console.print(f"[yellow]Could not load catalog {source}: {e}[/yellow]")
+    return merge_catalogs(loaded)
+
+def load_mcp_servers_async(catalogs: Optional[List[str]] = None, refresh: str = "blocking", github_token: Optional[str] = None) -> "Future[Optional[List[Dict[str, Any]]]]":
+    """Start loading the catalogs quietly on a daemon thread and return its Future.
+
+    Used to overlap the download with interactive prompts; a daemon thread is
+    used so cancelling the prompt never waits for the network.
+    """
+    return _run_in_daemon_thread(load_mcp_servers, catalogs, refresh=refresh, quiet=True, github_token=github_token, name="mcp-catalog-download")
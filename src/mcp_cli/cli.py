@@ -0,0 +1,71 @@
+"""Typer application for the ``mcp`` command."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import Optional
+
+import typer
+from typer.core import TyperGroup
+
+from . import __version__
+from .console import console, show_banner
+
+class BannerGroup(TyperGroup):
+    """Custom group that shows banner before help.
+
+    Commands live in ``mcp_cli.commands``, one module per command, and a
+    module is only imported when its command is dispatched (or listed by
+    ``--help``), so a run pays for the command it executes and nothing else.
+    """
+    
+    # Command name -> module in mcp_cli.commands, in help order
+    lazy_commands = {
+        "list": "list",
+        "search": "search",
+        "rm": "rm",
+        "check": "check",
+        "init": "init",
+    }
+    
+    def list_commands(self, ctx):
+        return list(self.lazy_commands)
+    
+    def get_command(self, ctx, cmd_name):
+        module_name = self.lazy_commands.get(cmd_name)
+        if module_name is None:
+            return None
+        module = importlib.import_module(f"{__package__}.commands.{module_name}")
+        return typer.main.get_command(module.app)
+
+    def format_help(self, ctx, formatter):
+        # Show banner before help
+        show_banner()
+        super().format_help(ctx, formatter)
+
+def version_callback(value: bool):
+    """Handle version flag."""
+    if value:
+        typer.echo(__version__)
+        raise typer.Exit()
+
+app = typer.Typer(
+    name="MCP-Gearbox",
+    help="Setup tool for MCP for agents",
+    add_completion=False,
+    invoke_without_command=True,
+    cls=BannerGroup,
+)
+
+@app.callback()
+def callback(
+    ctx: typer.Context,
+    version: Optional[bool] = typer.Option(None, "--version", "-v", callback=version_callback, is_eager=True, help="Show version and exit")
+):
+    """Show banner when no subcommand is provided."""
+    if ctx.invoked_subcommand is None and "--help" not in sys.argv and "-h" not in sys.argv and "--version" not in sys.argv and "-v" not in sys.argv:
+        from rich.align import Align
+        show_banner()
+        console.print(Align.center("[dim]Run 'mcp --help' for usage information[/dim]"))
+        console.print()
@@ -0,0 +1,5 @@
+"""CLI commands, one module per command.
+
+Each module defines a single-command ``app``; ``cli.BannerGroup`` imports a
+module only when its command is dispatched.
+"""
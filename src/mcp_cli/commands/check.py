@@ -0,0 +1,112 @@
+"""``mcp check``: report which agents are installed and configured."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import typer
+
+from ..console import console, show_banner
+from ..agents import AGENT_CONFIG, check_agent_installation
+from ..headless import check_json, run_json
+
+app = typer.Typer(add_completion=False)
+
+@app.command()
+def check(
+    agent: Optional[str] = typer.Option(None, "--agent", "-a", help="Specific agent to check (copilot, copilot-cli, continue, kiro, cursor, qoder, lmstudio, claude, gemini)"),
+    json_output: bool = typer.Option(False, "--json", "-j", help="Output in JSON format without banner or UI"),
+    pretty: bool = typer.Option(False, "--pretty", help="Pretty print JSON output (default: false)"),
+):
+    """Check which AI agents are installed on your system."""
+    if json_output:
+        run_json(check_json, pretty, agent=agent)
+    
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich.align import Align
+    from rich.table import Table
+    
+    show_banner()
+    
+    console.print(Panel(
+        Align.center(Text("Agent Installation Check", style="bold yellow")),
+        title="[bold cyan]System Check[/bold cyan]",
+        border_style="yellow",
+        padding=(0, 1),
+        height=3
+    ))
+    console.print()
+    
+    # Check specific agent or all agents
+    if agent:
+        if agent not in AGENT_CONFIG:
+            console.print(f"[red]Unknown agent: {agent}. Available: {', '.join(AGENT_CONFIG.keys())}[/red]")
+            raise typer.Exit(1)
+        agents_to_check = {agent: AGENT_CONFIG[agent]}
+    else:
+        agents_to_check = AGENT_CONFIG
+    
+    # Check each agent
+    results = []
+    with console.status("[bold green]Checking installed agents..."):
+        for agent_key, agent_config in agents_to_check.items():
+            result = check_agent_installation(agent_key, agent_config)
+            results.append(result)
+    
+    # Count installed and configured agents
+    installed_count = sum(1 for result in results if result["installed"])
+    configured_count = sum(1 for result in results if result["config_exists"])
+    
+    # Display results in a table
+    table = Table(show_header=True, box=None, padding=(0, 1))
+    table.add_column("Agent", style="white", min_width=15)
+    table.add_column("Status", style="white", width=12)
+    table.add_column("Config", style="white", width=8)
+    
+    for result in results:
+        # Status column
+        if result["installed"]:
+            status = Text("✓ Installed", style="bold green")
+        else:
+            status = Text("✗ Not Found", style="bold red")
+        
+        # Config column  
+        if result["config_exists"]:
+            config_status = Text("✓ Yes", style="green")
+        else:
+            config_status = Text("✗ No", style="red")
+        
+        # Agent name with install URL if available
+        agent_name = result["name"]
+        if not result["installed"] and result["install_url"]:
+            agent_name = f"{agent_name} (install: {result['install_url']})"
+        
+        table.add_row(
+            Text(agent_name, style="cyan"),
+            status,
+            config_status
+        )
+    
+    # Wrap table in a panel
+    summary = f"Found {installed_count}/{len(results)} installed, {configured_count}/{len(results)} configured"
+    panel = Panel(
+        table,
+        title="[bold cyan]AI Agent Status[/bold cyan]",
+        subtitle=f"[bold yellow]{summary}[/bold yellow]",
+        border_style="cyan",
+        padding=(1, 2)
+    )
+    
+    console.print(panel)
+    console.print()
+    
+    if installed_count == 0:
+        console.print("[yellow]No AI agents found installed on your system.[/yellow]")
+        console.print("[dim]Install an agent and run 'mcp init' to get started with MCP servers.[/dim]")
+    elif configured_count == 0:
+        console.print("[yellow]No agents have MCP configuration yet.[/yellow]")
+        console.print("[dim]Run 'mcp init' to configure MCP servers for your installed agents.[/dim]")
+    else:
+        console.print(f"[green]You have {configured_count} agent(s) with MCP configuration.[/green]")
+        console.print("[dim]Run 'mcp list' to see configured servers or 'mcp init' to add more.[/dim]")
@@ -0,0 +1,290 @@
+"""``mcp init``: add MCP servers to an agent configuration."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional, List
+
+import typer
+
+from ..console import console, show_banner
+from ..agents import AGENT_CONFIG, get_mcp_config_path
+from ..catalog import load_mcp_servers, load_mcp_servers_async
+from ..index import CatalogIndex
+from ..config import create_mcp_config, save_mcp_config
+from ..headless import init_json, run_json
+from ..options import refresh_callback
+
+app = typer.Typer(add_completion=False)
+
+@app.command()
+def init(
+    project_name: Optional[str] = typer.Argument(None, help="Name of the project to initialize (use '.' for current directory, omit for global configuration)"),
+    servers: Optional[List[str]] = typer.Option(None, "--servers", "-s", help="MCP server names to add directly. Use multiple times (-s git -s filesystem) or space-separated (-s 'git filesystem')"),
+    agent: Optional[str] = typer.Option(None, "--agent", "-a", help="Agent to configure (copilot, copilot-cli, continue, kiro, cursor, qoder, lmstudio, claude, gemini)"),
+    json_output: bool = typer.Option(False, "--json", "-j", help="Output in JSON format without banner or UI"),
+    pretty: bool = typer.Option(False, "--pretty", help="Pretty print JSON output (default: false)"),
+    refresh: str = typer.Option("background", "--refresh", callback=refresh_callback, help="When to refresh the cached server catalog: never, background (serve cache, refresh for next run; exit waits up to MCP_GEARBOX_REFRESH_GRACE seconds for it) or blocking"),
+    github_token: Optional[str] = typer.Option(None, "--github-token", help="GitHub token for catalog downloads (defaults to GH_TOKEN or GITHUB_TOKEN)"),
+    catalogs: Optional[List[str]] = typer.Option(None, "--catalog", help="Additional catalog file or URL merged over the public catalog. Repeatable; later catalogs take precedence"),
+):
+    """Initialize MCP configuration in a project directory or globally."""
+    if json_output:
+        run_json(init_json, pretty, project_name=project_name, servers=servers, agent=agent, refresh=refresh, github_token=github_token, catalogs=catalogs)
+    
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich.align import Align
+    from rich.table import Table
+    
+    # Start fetching the catalog right away so it overlaps with interactive agent selection
+    catalog_future = None
+    if not agent:
+        catalog_future = load_mcp_servers_async(catalogs, refresh=refresh, github_token=github_token)
+    
+    show_banner()
+    
+    # Determine if this is global configuration (when no project name is provided)
+    is_global = project_name is None
+    
+    if is_global:
+        # Global configuration mode
+        project_info = None
+        project_path = None
+        console.print(Panel(
+            Align.center(Text("Global MCP Configuration", style="bold yellow")),
+            title="[bold cyan]Setup Mode[/bold cyan]",
+            border_style="yellow",
+            padding=(0, 1),
+            height=3
+        ))
+        console.print()
+    else:
+        # Project-specific configuration mode
+        working_directory = Path.cwd()
+        if project_name == ".":
+            project_path = working_directory
+            target_directory = working_directory
+            directory_created = False
+        else:
+            project_path = working_directory / project_name
+            target_directory = project_path
+            
+            # Check if directory exists before creating
+            directory_existed = project_path.exists()
+            
+            # Create project directory if it doesn't exist
+            if not directory_existed:
+                project_path.mkdir(parents=True, exist_ok=True)
+                directory_created = True
+            else:
+                directory_created = False
+        
+        # Prepare project info for display
+        project_info = {
+            "project_name": project_name,
+            "working_directory": str(working_directory),
+            "target_directory": str(target_directory)
+        }
+        
+        # Display project setup information
+        setup_table = Table(show_header=False, box=None, padding=(0, 1))
+        setup_table.add_column("Label", style="cyan", width=18)
+        setup_table.add_column("Path", style="white")
+        
+        setup_table.add_row("Project:", project_name)
+        setup_table.add_row("Working Path:", str(working_directory))
+        setup_table.add_row("Target Path:", str(target_directory))
+        
+        setup_panel = Panel(
+            setup_table,
+            title="[bold cyan]Project Setup[/bold cyan]",
+            border_style="cyan",
+            padding=(1, 2)
+        )
+        
+        console.print(setup_panel)
+        console.print()
+        
+        if project_name != "." and directory_created:
+            console.print(f"[green]✓ Created project directory: {project_path}[/green]")
+    
+    # Download MCP servers (already in flight when the agent is chosen interactively)
+    if catalog_future is None:
+        available_servers = load_mcp_servers(catalogs, refresh=refresh, github_token=github_token)
+        if not available_servers:
+            raise typer.Exit(1)
+        
+        console.print(f"[green]✓ Downloaded {len(available_servers)} MCP servers[/green]")
+    
+    # Select agent if not provided
+    if not agent:
+        from ..tui import select_agent
+        agent = select_agent(project_info)
+        if not agent:
+            console.print("[red]No agent selected. Exiting.[/red]")
+            raise typer.Exit(1)
+    
+    if catalog_future is not None:
+        # Only blocks if the download has not finished while the agent was being chosen
+        if catalog_future.done():
+            available_servers = catalog_future.result()
+        else:
+            with console.status("[bold green]Downloading MCP servers..."):
+                available_servers = catalog_future.result()
+        if not available_servers:
+            console.print("[red]Failed to download MCP servers[/red]")
+            raise typer.Exit(1)
+        
+        console.print(f"[green]✓ Downloaded {len(available_servers)} MCP servers[/green]")
+    
+    if agent not in AGENT_CONFIG:
+        console.print(f"[red]Unknown agent: {agent}. Available: {', '.join(AGENT_CONFIG.keys())}[/red]")
+        raise typer.Exit(1)
+    
+    console.print(f"\n[bold green]Selected Agent: {AGENT_CONFIG[agent]['name']}[/bold green]")
+    
+    # Check if agent supports project-level configuration
+    if agent == "qoder":
+        console.print(f"[yellow]⚠️  Note: Qoder does not support project-level MCP configuration.[/yellow]")
+        console.print(f"[yellow]   Configuration will be saved to global Qoder settings instead.[/yellow]")
+        console.print()
+    elif agent == "copilot-cli":
+        console.print(f"[yellow]⚠️  Note: Copilot CLI does not support project-level MCP configuration.[/yellow]")
+        console.print(f"[yellow]   Configuration will be saved to global Copilot CLI settings instead.[/yellow]")
+        console.print()
+    elif agent == "lmstudio":
+        console.print(f"[yellow]⚠️  Note: LM Studio does not need project-level MCP configuration.[/yellow]")
+        console.print(f"[yellow]   Configuration will be saved to global LM Studio settings instead.[/yellow]")
+        console.print()
+    elif agent == "claude":
+        if is_global:
+            console.print(f"[cyan]ℹ️  Claude global configuration will be saved to ~/.claude.json[/cyan]")
+        else:
+            console.print(f"[cyan]ℹ️  Claude project configuration will be saved to .mcp.json[/cyan]")
+        console.print()
+    elif agent == "gemini":
+        if is_global:
+            console.print(f"[cyan]ℹ️  Gemini global configuration will be saved to ~/.gemini/settings.json[/cyan]")
+        else:
+            console.print(f"[cyan]ℹ️  Gemini project configuration will be saved to .gemini/settings.json[/cyan]")
+        console.print()
+    
+    # Select MCP servers - either from command line arguments or interactive selection
+    if servers:
+        # Direct server specification via command line
+        # Handle both formats: -s git -s filesystem AND -s "git filesystem"
+        flattened_servers = []
+        for server_spec in servers:
+            # Split by spaces to handle "git filesystem" format
+            flattened_servers.extend(server_spec.split())
+        
+        catalog_index = CatalogIndex(available_servers)
+        selected_servers, not_found_servers, ambiguous_servers = catalog_index.resolve(flattened_servers)
+        
+        if ambiguous_servers:
+            for server_name, mcp_keys in ambiguous_servers.items():
+                console.print(f"[yellow]Ambiguous server name '{server_name}'. Multiple matches found:[/yellow]")
+                for mcp_key in mcp_keys:
+                    console.print(f"  • {mcp_key}")
+            console.print(f"[yellow]Please use the full server name to specify which one to add.[/yellow]")
+        
+        if ambiguous_servers and not not_found_servers:
+            raise typer.Exit(1)
+        
+        if not_found_servers:
+            error_msg = f"Could not find servers: {', '.join(not_found_servers)}"
+            console.print(f"[red]{error_msg}[/red]")
+            for server_name in not_found_servers:
+                names = catalog_index.suggest(server_name)
+                if names:
+                    console.print(f"[yellow]'{server_name}' not found. Did you mean: {', '.join(names)}?[/yellow]")
+            console.print("[dim]Use 'mcp search <query>' or 'mcp list --servers' to browse available servers.[/dim]")
+            raise typer.Exit(1)
+        
+        console.print(f"\n[bold green]Selected {len(selected_servers)} MCP servers directly[/bold green]")
+    else:
+        # Interactive server selection
+        from ..tui import select_mcp_servers
+        selected_servers = select_mcp_servers(available_servers, agent, project_info)
+        if selected_servers is None:
+            console.print("[red]Server selection cancelled. Exiting.[/red]")
+            raise typer.Exit(1)
+        if not selected_servers:
+            console.print("[yellow]No servers selected. Exiting.[/yellow]")
+            raise typer.Exit(0)
+        
+        console.print(f"\n[bold green]Selected {len(selected_servers)} MCP servers[/bold green]")
+    
+    # Create configuration
+    config = create_mcp_config(selected_servers, agent)
+    
+    # Get configuration path based on mode (global vs project-specific)
+    if is_global or agent == "qoder" or agent == "lmstudio" or agent == "copilot-cli":
+        config_path = get_mcp_config_path(agent)  # Global path
+    else:
+        config_path = get_mcp_config_path(agent, project_path)  # Project-specific path
+    
+    # Save configuration
+    if save_mcp_config(config, config_path, agent, selected_servers=selected_servers):
+        if is_global:
+            console.print(f"\n[bold green]🎉 MCP global configuration completed successfully![/bold green]")
+            
+            # Show next steps for global configuration
+            console.print(f"\n[bold cyan]Next steps:[/bold cyan]")
+            console.print(f"1. Open {AGENT_CONFIG[agent]['name']}")
+            console.print(f"2. The MCP servers will be loaded from global settings")
+            if agent == "copilot":
+                console.print(f"3. Make sure you have the GitHub Copilot extension installed in VS Code")
+            elif agent == "continue":
+                console.print(f"3. Make sure you have the Continue extension installed in your IDE")
+            elif agent == "kiro":
+                console.print(f"3. The configuration is available across all Kiro projects")
+            elif agent == "cursor":
+                console.print(f"3. The configuration is available across all Cursor projects")
+            elif agent == "qoder":
+                console.print(f"3. The configuration is available across all Qoder projects")
+            elif agent == "lmstudio":
+                console.print(f"3. The configuration is available across all LM Studio projects")
+            elif agent == "claude":
+                console.print(f"3. Use 'claude' command to start a new conversation")
+            elif agent == "gemini":
+                console.print(f"3. Use 'gemini' command to start a new conversation")
+            elif agent == "copilot-cli":
+                console.print(f"3. Use 'copilot' command to start a new conversation")
+        else:
+            console.print(f"\n[bold green]🎉 MCP project initialization completed successfully![/bold green]")
+            
+            # Show next steps for project configuration
+            console.print(f"\n[bold cyan]Next steps:[/bold cyan]")
+            console.print(f"1. Open your project in {AGENT_CONFIG[agent]['name']}")
+            
+            if agent == "qoder":
+                console.print(f"2. The MCP servers will be loaded from global Qoder settings")
+                console.print(f"3. Open the project in Qoder IDE")
+            elif agent == "copilot-cli":
+                console.print(f"2. The MCP servers will be loaded from global Copilot CLI settings")
+                console.print(f"3. Open the chat in Copilot CLI")
+            elif agent == "lmstudio":
+                console.print(f"2. The MCP servers will be loaded from global LM Studio settings")
+                console.print(f"3. Open the chat in LM Studio")
+            else:
+                console.print(f"2. The MCP servers will be automatically loaded from: {config_path.relative_to(project_path)}")
+                if agent == "copilot":
+                    console.print(f"3. Make sure you have the GitHub Copilot extension installed in VS Code")
+                elif agent == "continue":
+                    console.print(f"3. Make sure you have the Continue extension installed in your IDE")
+                elif agent == "kiro":
+                    console.print(f"3. Open the project in Kiro IDE")
+                elif agent == "cursor":
+                    console.print(f"3. Open the project in Cursor IDE")
+                elif agent == "lmstudio":
+                    console.print(f"3. Open the chat in LM Studio")
+                elif agent == "claude":
+                    console.print(f"3. Use 'claude' command in this project directory")
+                    console.print(f"4. The MCP servers will be automatically loaded from .mcp.json")
+                elif agent == "gemini":
+                    console.print(f"3. Use 'gemini' command in this project directory")
+                    console.print(f"4. The MCP servers will be automatically loaded from .gemini/settings.json")
+    else:
+        raise typer.Exit(1)
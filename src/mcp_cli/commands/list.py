@@ -0,0 +1,218 @@
+"""``mcp list``: show configured or available MCP servers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional, List
+
+import typer
+
+from ..console import console, show_banner
+from ..agents import AGENT_CONFIG, get_mcp_config_path
+from ..catalog import load_mcp_servers
+from ..index import CatalogOrder
+from ..config import get_configured_server_metadata, list_configured_servers, load_existing_mcp_config, match_configured_servers
+from ..headless import list_json, run_json
+from ..options import refresh_callback, sort_callback
+
+app = typer.Typer(add_completion=False)
+
+@app.command("list")
+def list_servers(
+    agent: Optional[str] = typer.Option(None, "--agent", "-a", help="Agent to list servers for (copilot, copilot-cli, continue, kiro, cursor, qoder, lmstudio, claude, gemini)"),
+    project_path: Optional[str] = typer.Option(None, "--project", "-p", help="Project path (use '.' for current directory, omit for global configuration)"),
+    available_servers: bool = typer.Option(False, "--servers", "-s", help="List all available MCP servers instead of configured ones"),
+    json_output: bool = typer.Option(False, "--json", "-j", help="Output in JSON format without banner or UI"),
+    pretty: bool = typer.Option(False, "--pretty", help="Pretty print JSON output (default: false)"),
+    refresh: str = typer.Option("background", "--refresh", callback=refresh_callback, help="When to refresh the cached server catalog: never, background (serve cache, refresh for next run; exit waits up to MCP_GEARBOX_REFRESH_GRACE seconds for it) or blocking"),
+    github_token: Optional[str] = typer.Option(None, "--github-token", help="GitHub token for catalog downloads (defaults to GH_TOKEN or GITHUB_TOKEN)"),
+    catalogs: Optional[List[str]] = typer.Option(None, "--catalog", help="Additional catalog file or URL merged over the public catalog. Repeatable; later catalogs take precedence"),
+    refresh_metadata: bool = typer.Option(False, "--refresh-metadata", help="Re-read server names, authors and stars from the catalog instead of the locally recorded copy"),
+    sort: Optional[str] = typer.Option(None, "--sort", callback=sort_callback, help="Sort servers by stars, name, org or updated (default: catalog order, or configuration order for configured servers)"),
+):
+    """List configured MCP servers or all available servers."""
+    if json_output:
+        run_json(list_json, pretty, agent=agent, project_path=project_path, available_servers=available_servers, refresh=refresh, github_token=github_token, catalogs=catalogs, refresh_metadata=refresh_metadata, sort=sort)
+    
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich.align import Align
+    from rich.table import Table
+    
+    # Handle listing available servers
+    if available_servers:
+        # Download MCP servers
+        servers_data = load_mcp_servers(catalogs, refresh=refresh, github_token=github_token)
+        if not servers_data:
+            console.print("[red]Failed to download MCP servers[/red]")
+            raise typer.Exit(1)
+        
+        servers_data = CatalogOrder(servers_data).apply(servers_data, sort)
+        
+        show_banner()
+        console.print(Panel(
+            Align.center(Text("Available MCP Servers", style="bold yellow")),
+            title="[bold cyan]Servers List[/bold cyan]",
+            border_style="yellow",
+            padding=(0, 1),
+            height=3
+        ))
+        console.print()
+        
+        # Display servers in table format
+        table = Table(show_header=False, box=None, padding=(0, 1))
+        table.add_column("Server", style="white", min_width=20)
+        table.add_column("By", style="dim", width=28)
+        table.add_column("Stars", style="dim", width=10)
+        
+        for server in servers_data:
+            # Get by (author/organization) field with "By " prefix
+            by_org = server.get('by', 'Unknown')
+            # Truncate long organization names to fit in column
+            if len(by_org) > 20:
+                by_org = by_org[:20] + "..."
+            by_text = f"By: {by_org}"
+            
+            # Get stargazer_count and format it with unfilled star icon
+            stars = server.get('stargazer_count', 0)
+            if stars >= 1000:
+                stars_text = f"☆ {stars/1000:.1f}k"
+            else:
+                stars_text = f"☆ {stars}"
+            
+            table.add_row(
+                Text(server['name'], style="white"),
+                Text(by_text, style="dim"),
+                Text(stars_text, style="dim")
+            )
+        
+        # Wrap table in a panel with border
+        panel = Panel(
+            table,
+            title=f"[bold cyan]Available MCP Servers ({len(servers_data)} total)[/bold cyan]",
+            border_style="cyan",
+            padding=(1, 2)
+        )
+        
+        console.print(panel)
+        console.print()
+        console.print(Text("Use 'mcp init --servers <server_name> -a <agent>' to add servers to your configuration", style="dim"))
+        
+        return
+    
+    # Original logic for listing configured servers
+    show_banner()
+    
+    # Determine if this is global configuration
+    is_global = project_path is None
+    
+    if is_global:
+        console.print(Panel(
+            Align.center(Text("Global MCP Configuration", style="bold yellow")),
+            title="[bold cyan]List Mode[/bold cyan]",
+            border_style="yellow",
+            padding=(0, 1),
+            height=3
+        ))
+        console.print()
+    else:
+        console.print(Panel(
+            Align.center(Text(f"Project: {project_path}", style="bold yellow")),
+            title="[bold cyan]List Mode[/bold cyan]",
+            border_style="yellow",
+            padding=(0, 1),
+            height=3
+        ))
+        console.print()
+    
+    if not is_global:
+        working_directory = Path.cwd()
+        if project_path == ".":
+            target_path = working_directory
+        else:
+            target_path = working_directory / project_path
+            
+        if not target_path.exists():
+            console.print(f"[red]Project directory does not exist: {target_path}[/red]")
+            raise typer.Exit(1)
+    else:
+        target_path = None
+    
+    # Select agent if not provided
+    if not agent:
+        from ..tui import select_agent
+        agent = select_agent()
+        if not agent:
+            console.print("[red]No agent selected. Exiting.[/red]")
+            raise typer.Exit(1)
+    
+    if agent not in AGENT_CONFIG:
+        console.print(f"[red]Unknown agent: {agent}. Available: {', '.join(AGENT_CONFIG.keys())}[/red]")
+        raise typer.Exit(1)
+    
+    console.print(f"[bold green]Selected Agent: {AGENT_CONFIG[agent]['name']}[/bold green]")
+    
+    # Get configuration path
+    if is_global or agent == "qoder" or agent == "lmstudio" or agent == "copilot-cli":
+        config_path = get_mcp_config_path(agent)
+    else:
+        config_path = get_mcp_config_path(agent, target_path)
+    
+    console.print(f"[dim]Configuration path: {config_path}[/dim]")
+    console.print()
+    
+    # Load existing configuration
+    existing_config = load_existing_mcp_config(config_path, agent)
+    if not existing_config:
+        console.print(f"[yellow]No MCP configuration found at: {config_path}[/yellow]")
+        console.print("[dim]Run 'mcp init' to create a new configuration.[/dim]")
+        raise typer.Exit(0)
+    
+    # Get list of configured servers
+    configured_servers = list_configured_servers(existing_config, agent)
+    if not configured_servers:
+        console.print("[yellow]No MCP servers are currently configured.[/yellow]")
+        console.print("[dim]Run 'mcp init' to add MCP servers.[/dim]")
+        raise typer.Exit(0)
+    
+    # Display data comes from the locally recorded metadata, falling back to the catalog
+    metadata = get_configured_server_metadata(config_path, configured_servers, agent, catalogs, refresh, github_token, refresh_metadata)
+    matched_servers = match_configured_servers(configured_servers, metadata, agent)
+    matched_servers = CatalogOrder(matched_servers).apply(matched_servers, sort)
+    
+    # Display servers in the same format as mcp init (Server, By, Stars)
+    table = Table(show_header=False, box=None, padding=(0, 1))
+    table.add_column("Server", style="white", min_width=20)
+    table.add_column("By", style="dim", width=28)
+    table.add_column("Stars", style="dim", width=10)
+    
+    for server in matched_servers:
+        # Get by (author/organization) field with "By " prefix
+        by_org = server.get('by', 'Unknown')
+        # Truncate long organization names to fit in column
+        if len(by_org) > 20:
+            by_org = by_org[:20] + "..."
+        by_text = f"By: {by_org}"
+        
+        # Get stargazer_count and format it with unfilled star icon
+        stars = server.get('stargazer_count', 0)
+        if stars >= 1000:
+            stars_text = f"☆ {stars/1000:.1f}k"
+        else:
+            stars_text = f"☆ {stars}"
+        
+        table.add_row(
+            Text(server['name'], style="cyan"),
+            Text(by_text, style="dim"),
+            Text(stars_text, style="dim")
+        )
+    
+    # Wrap table in a panel
+    panel = Panel(
+        table,
+        title=f"[bold cyan]Configured MCP Servers ({len(configured_servers)})[/bold cyan]",
+        border_style="cyan",
+        padding=(1, 2)
+    )
+    
+    console.print(panel)
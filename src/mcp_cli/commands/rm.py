@@ -0,0 +1,192 @@
+"""``mcp rm``: remove MCP servers from an agent configuration."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional, List
+
+import typer
+
+from ..console import console, show_banner
+from ..agents import AGENT_CONFIG, get_mcp_config_path
+from ..config import get_configured_server_metadata, list_configured_servers, load_existing_mcp_config, remove_servers
+from ..headless import rm_json, run_json
+from ..options import refresh_callback
+
+app = typer.Typer(add_completion=False)
+
+@app.command()
+def rm(
+    servers: Optional[List[str]] = typer.Argument(None, help="MCP server names to remove (e.g., 'git', 'filesystem')"),
+    all_servers: bool = typer.Option(False, "--all", "-A", help="Remove all MCP servers"),
+    agent: Optional[str] = typer.Option(None, "--agent", "-a", help="Agent to configure (copilot, copilot-cli, continue, kiro, cursor, qoder, lmstudio, claude, gemini)"),
+    project_path: Optional[str] = typer.Option(None, "--project", "-p", help="Project path (use '.' for current directory, omit for global configuration)"),
+    force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation prompts"),
+    json_output: bool = typer.Option(False, "--json", "-j", help="Output in JSON format without banner or UI"),
+    pretty: bool = typer.Option(False, "--pretty", help="Pretty print JSON output (default: false)"),
+    refresh: str = typer.Option("background", "--refresh", callback=refresh_callback, help="When to refresh the cached server catalog: never, background (serve cache, refresh for next run; exit waits up to MCP_GEARBOX_REFRESH_GRACE seconds for it) or blocking"),
+    github_token: Optional[str] = typer.Option(None, "--github-token", help="GitHub token for catalog downloads (defaults to GH_TOKEN or GITHUB_TOKEN)"),
+    catalogs: Optional[List[str]] = typer.Option(None, "--catalog", help="Additional catalog file or URL merged over the public catalog. Repeatable; later catalogs take precedence"),
+    refresh_metadata: bool = typer.Option(False, "--refresh-metadata", help="Re-read server names, authors and stars from the catalog instead of the locally recorded copy"),
+):
+    """Remove MCP servers from configuration."""
+    if json_output:
+        run_json(rm_json, pretty, servers=servers, all_servers=all_servers, agent=agent, project_path=project_path)
+    
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich.align import Align
+    from rich.prompt import Confirm
+    
+    show_banner()
+    
+    # Determine if this is global configuration
+    is_global = project_path is None
+    
+    if is_global:
+        console.print(Panel(
+            Align.center(Text("Global MCP Configuration", style="bold yellow")),
+            title="[bold cyan]Remove Mode[/bold cyan]",
+            border_style="yellow",
+            padding=(0, 1),
+            height=3
+        ))
+        console.print()
+    else:
+        console.print(Panel(
+            Align.center(Text(f"Project: {project_path}", style="bold yellow")),
+            title="[bold cyan]Remove Mode[/bold cyan]",
+            border_style="yellow",
+            padding=(0, 1),
+            height=3
+        ))
+        console.print()
+    
+    if not is_global:
+        working_directory = Path.cwd()
+        if project_path == ".":
+            target_path = working_directory
+        else:
+            target_path = working_directory / project_path
+            
+        if not target_path.exists():
+            console.print(f"[red]Project directory does not exist: {target_path}[/red]")
+            raise typer.Exit(1)
+        target_path = target_path
+    else:
+        target_path = None
+    
+    # Select agent if not provided
+    if not agent:
+        from ..tui import select_agent
+        agent = select_agent()
+        if not agent:
+            console.print("[red]No agent selected. Exiting.[/red]")
+            raise typer.Exit(1)
+    
+    if agent not in AGENT_CONFIG:
+        console.print(f"[red]Unknown agent: {agent}. Available: {', '.join(AGENT_CONFIG.keys())}[/red]")
+        raise typer.Exit(1)
+    
+    console.print(f"[bold green]Selected Agent: {AGENT_CONFIG[agent]['name']}[/bold green]")
+    
+    # Get configuration path
+    if is_global or agent == "qoder" or agent == "lmstudio" or agent == "copilot-cli":
+        config_path = get_mcp_config_path(agent)
+    else:
+        config_path = get_mcp_config_path(agent, target_path)
+    
+    # Load existing configuration
+    existing_config = load_existing_mcp_config(config_path, agent)
+    if not existing_config:
+        console.print(f"[yellow]No MCP configuration found at: {config_path}[/yellow]")
+        raise typer.Exit(0)
+    
+    # Get list of configured servers
+    configured_servers = list_configured_servers(existing_config, agent)
+    if not configured_servers:
+        console.print("[yellow]No MCP servers are currently configured.[/yellow]")
+        raise typer.Exit(0)
+    
+    console.print(f"\n[cyan]Currently configured servers ({len(configured_servers)}):[/cyan]")
+    for server in configured_servers:
+        console.print(f"  • {server}")
+    console.print()
+    
+    # Determine which servers to remove
+    if all_servers:
+        servers_to_remove = configured_servers.copy()
+        if not force:
+            if not Confirm.ask(f"[bold red]Are you sure you want to remove ALL {len(servers_to_remove)} MCP servers?[/bold red]"):
+                console.print("[yellow]Operation cancelled.[/yellow]")
+                raise typer.Exit(0)
+    elif servers:
+        servers_to_remove = servers
+        if not force:
+            console.print(f"[yellow]Servers to remove: {', '.join(servers_to_remove)}[/yellow]")
+            if not Confirm.ask("Continue with removal?"):
+                console.print("[yellow]Operation cancelled.[/yellow]")
+                raise typer.Exit(0)
+    else:
+        # Interactive server selection for removal
+        # Display data comes from the locally recorded metadata, falling back to the catalog
+        metadata = get_configured_server_metadata(config_path, configured_servers, agent, catalogs, refresh, github_token, refresh_metadata)
+        
+        # Prepare project info for display if in project mode
+        project_info = None
+        if not is_global:
+            project_info = {
+                "project_name": target_path.name if target_path else "current",
+                "working_directory": str(Path.cwd()),
+                "target_directory": str(target_path) if target_path else str(Path.cwd())
+            }
+        
+        from ..tui import select_servers_to_remove
+        selected_servers = select_servers_to_remove(configured_servers, metadata, agent, project_info)
+        
+        if selected_servers is None:
+            console.print("[yellow]Server selection cancelled.[/yellow]")
+            raise typer.Exit(0)
+        if not selected_servers:
+            console.print("[yellow]No servers selected for removal.[/yellow]")
+            raise typer.Exit(0)
+        
+        servers_to_remove = selected_servers
+        
+        if not force:
+            console.print(f"[yellow]Selected servers to remove: {', '.join(servers_to_remove)}[/yellow]")
+            if not Confirm.ask("Continue with removal?"):
+                console.print("[yellow]Operation cancelled.[/yellow]")
+                raise typer.Exit(0)
+    
+    # Remove servers from configuration and save it
+    try:
+        removed_servers, not_found_servers, remaining_servers = remove_servers(config_path, servers_to_remove, agent)
+    except Exception as e:
+        console.print(f"[red]Failed to save configuration: {str(e)}[/red]")
+        raise typer.Exit(1)
+    
+    # Report results
+    if removed_servers:
+        console.print(f"[green]✓ Successfully removed {len(removed_servers)} server(s):[/green]")
+        for server in removed_servers:
+            console.print(f"  • {server}")
+    
+    if not_found_servers:
+        console.print(f"[yellow]⚠ Could not find {len(not_found_servers)} server(s):[/yellow]")
+        for server in not_found_servers:
+            console.print(f"  • {server}")
+    
+    if not removed_servers:
+        console.print("[yellow]No servers were removed.[/yellow]")
+        raise typer.Exit(0)
+    
+    console.print(f"\n[green]✓ Configuration updated: {config_path}[/green]")
+    
+    # Show remaining servers
+    if remaining_servers:
+        console.print(f"\n[cyan]Remaining servers ({len(remaining_servers)}):[/cyan]")
+        for server in remaining_servers:
+            console.print(f"  • {server}")
+    else:
+        console.print(f"\n[dim]No MCP servers remain in the configuration.[/dim]")
@@ -0,0 +1,90 @@
+"""``mcp search``: rank catalog servers by relevance."""
+
+from __future__ import annotations
+
+from typing import Optional, List
+
+import typer
+
+from ..console import console, show_banner
+from ..catalog import load_mcp_servers
+from ..index import CatalogSearch
+from ..headless import run_json, search_json
+from ..options import refresh_callback, search_fields_callback
+
+app = typer.Typer(add_completion=False)
+
+@app.command()
+def search(
+    query: List[str] = typer.Argument(..., help="Search terms (e.g., 'postgres', 'browser automation')"),
+    fields: Optional[List[str]] = typer.Option(None, "--field", "-f", callback=search_fields_callback, help="Only search these fields: name, by, key, description. Repeatable (default: all)"),
+    limit: int = typer.Option(10, "--limit", "-n", min=1, help="Maximum number of results"),
+    json_output: bool = typer.Option(False, "--json", "-j", help="Output in JSON format without banner or UI"),
+    pretty: bool = typer.Option(False, "--pretty", help="Pretty print JSON output (default: false)"),
+    refresh: str = typer.Option("background", "--refresh", callback=refresh_callback, help="When to refresh the cached server catalog: never, background (serve cache, refresh for next run; exit waits up to MCP_GEARBOX_REFRESH_GRACE seconds for it) or blocking"),
+    github_token: Optional[str] = typer.Option(None, "--github-token", help="GitHub token for catalog downloads (defaults to GH_TOKEN or GITHUB_TOKEN)"),
+    catalogs: Optional[List[str]] = typer.Option(None, "--catalog", help="Additional catalog file or URL merged over the public catalog. Repeatable; later catalogs take precedence"),
+):
+    """Search available MCP servers by name, author, key or description."""
+    query_text = " ".join(query)
+    
+    if json_output:
+        run_json(search_json, pretty, query_text=query_text, fields=fields, limit=limit, refresh=refresh, github_token=github_token, catalogs=catalogs)
+    
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich.table import Table
+    
+    servers_data = load_mcp_servers(catalogs, refresh=refresh, github_token=github_token)
+    if not servers_data:
+        console.print("[red]Failed to download MCP servers[/red]")
+        raise typer.Exit(1)
+    
+    matches = CatalogSearch(servers_data).search(query_text, fields)
+    results = matches[:limit]
+    
+    show_banner()
+    
+    if not results:
+        console.print(f"[yellow]No MCP servers match '{query_text}'.[/yellow]")
+        console.print("[dim]Use 'mcp list --servers' to see all available servers.[/dim]")
+        return
+    
+    table = Table(show_header=False, box=None, padding=(0, 1))
+    table.add_column("Server", style="white", min_width=20)
+    table.add_column("By", style="dim", width=28)
+    table.add_column("Stars", style="dim", width=10)
+    table.add_column("Key", style="dim", overflow="fold")
+    
+    for server, _ in results:
+        # Get by (author/organization) field with "By " prefix
+        by_org = server.get('by', 'Unknown')
+        # Truncate long organization names to fit in column
+        if len(by_org) > 20:
+            by_org = by_org[:20] + "..."
+        by_text = f"By: {by_org}"
+        
+        # Get stargazer_count and format it with unfilled star icon
+        stars = server.get('stargazer_count', 0)
+        if stars >= 1000:
+            stars_text = f"☆ {stars/1000:.1f}k"
+        else:
+            stars_text = f"☆ {stars}"
+        
+        table.add_row(
+            Text(server['name'], style="cyan"),
+            Text(by_text, style="dim"),
+            Text(stars_text, style="dim"),
+            Text(", ".join(server.get("mcp", {}).keys()), style="dim")
+        )
+    
+    panel = Panel(
+        table,
+        title=f"[bold cyan]Search results for '{query_text}' ({len(results)} of {len(matches)})[/bold cyan]",
+        border_style="cyan",
+        padding=(1, 2)
+    )
+    
+    console.print(panel)
+    console.print()
+    console.print(Text("Use 'mcp init --servers <server_name> -a <agent>' to add servers to your configuration", style="dim"))
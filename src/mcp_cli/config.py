@@ -0,0 +1,608 @@
+"""Reading and writing agent MCP configurations and their metadata sidecars."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import re
+import secrets
+import stat
+import time
+from pathlib import Path
+from typing import Optional, Tuple, List, Dict, Any, Iterable, Iterator
+
+from platformdirs import user_data_dir
+
+from .console import console
+from .catalog import load_mcp_servers, _write_json_atomic
+from .index import CatalogIndex
+from .network import _env_seconds
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+CONFIG_LOCK_TIMEOUT = 10.0  # Seconds; override with MCP_GEARBOX_LOCK_TIMEOUT
+CONFIG_LOCK_MAX_POLL = 0.1  # Longest pause in seconds between lock attempts
+
+# Lock activity of this invocation, reported in --json output
+config_lock: Dict[str, Any] = {}
+
+_DECODER = json.JSONDecoder()
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+class ConfigDocument:
+    """A JSON config file whose top-level members can be replaced in place.
+
+    Agent config files can be large and mostly unrelated to MCP (Claude keeps
+    its whole project history in ``~/.claude.json``). Only the top-level
+    object is walked: each member value is decoded with ``raw_decode`` and
+    its span in the text is recorded. ``set`` records a new value for one
+    member and ``render`` splices just that span, so every other byte of the
+    file is kept as it was. Setting a member to its current value is a no-op,
+    and ``changed`` tells callers whether anything needs to be written.
+    """
+    
+    def __init__(self, text: Optional[str] = None):
+        self.text = text
+        self.data: Dict[str, Any] = {}
+        self._spans: Dict[str, Tuple[int, int, int]] = {}
+        self._updates: Dict[str, Any] = {}
+        # Identity of the file the text was read from, see _file_signature
+        self.signature: Optional[Tuple[int, int, int]] = None
+        if text is not None:
+            self._scan(text)
+    
+    @classmethod
+    def load(cls, config_path: Path) -> "ConfigDocument":
+        """Read a config file; line endings are kept so unchanged bytes stay unchanged."""
+        signature = _file_signature(config_path)
+        with open(config_path, 'r', encoding='utf-8', newline='') as f:
+            document = cls(f.read())
+        document.signature = signature
+        return document
+    
+    def _scan(self, text: str) -> None:
+        """Decode the top-level members and record the key start and value span of each."""
+        pos = _WHITESPACE.match(text, 1 if text.startswith('\ufeff') else 0).end()
+        if text[pos:pos + 1] != '{':
+            raise ValueError("Expecting a JSON object at the top level")
+        pos = _WHITESPACE.match(text, pos + 1).end()
+        if text[pos:pos + 1] != '}':
+            while True:
+                if text[pos:pos + 1] != '"':
+                    raise ValueError(f"Expecting property name at char {pos}")
+                key_start = pos
+                key, pos = _DECODER.raw_decode(text, pos)
+                pos = _WHITESPACE.match(text, pos).end()
+                if text[pos:pos + 1] != ':':
+                    raise ValueError(f"Expecting ':' delimiter at char {pos}")
+                value_start = _WHITESPACE.match(text, pos + 1).end()
+                value, value_end = _DECODER.raw_decode(text, value_start)
+                # Later duplicates win, as with json.load
+                self.data[key] = value
+                self._spans[key] = (key_start, value_start, value_end)
+                pos = _WHITESPACE.match(text, value_end).end()
+                if text[pos:pos + 1] == ',':
+                    pos = _WHITESPACE.match(text, pos + 1).end()
+                elif text[pos:pos + 1] == '}':
+                    break
+                else:
+                    raise ValueError(f"Expecting ',' delimiter at char {pos}")
+        if _WHITESPACE.match(text, pos + 1).end() != len(text):
+            raise ValueError(f"Extra data at char {pos + 1}")
+    
+    def set(self, key: str, value: Any) -> None:
+        """Replace or add a top-level member, unless it already holds ``value``."""
+        if key in self.data and self.data[key] == value:
+            return
+        self.data[key] = value
+        self._updates[key] = value
+    
+    @property
+    def changed(self) -> bool:
+        return bool(self._updates)
+    
+    def render(self) -> str:
+        """Return the file text with the updated members spliced in."""
+        return ''.join(self._pieces())
+    
+    def _pieces(self) -> List[str]:
+        """Split the rendered text into the unchanged slices and the new member text."""
+        if self.text is None or not self._spans:
+            return [json.dumps(self.data, indent=2)]
+        
+        # Follow the file's own indentation and line endings for the new text
+        first_key = min(start for start, _, _ in self._spans.values())
+        line_start = self.text.rfind('\n', 0, first_key) + 1
+        indent = self.text[line_start:first_key]
+        if not line_start or indent.strip():
+            indent = None
+        newline = '\r\n' if self.text[line_start - 2:line_start] == '\r\n' else '\n'
+        
+        def encode(value: Any) -> str:
+            if indent is None:
+                return json.dumps(value)
+            return json.dumps(value, indent=indent).replace('\n', newline + indent)
+        
+        replaced = sorted((self._spans[key][1], self._spans[key][2], key) for key in self._updates if key in self._spans)
+        pieces = []
+        pos = 0
+        for value_start, value_end, key in replaced:
+            pieces.append(self.text[pos:value_start])
+            pieces.append(encode(self._updates[key]))
+            pos = value_end
+        
+        # New members go after the last existing one
+        last_end = max(end for _, _, end in self._spans.values())
+        pieces.append(self.text[pos:last_end])
+        separator = ', ' if indent is None else ',' + newline + indent
+        for key, value in self._updates.items():
+            if key not in self._spans:
+                pieces.append(f"{separator}{json.dumps(key)}: {encode(value)}")
+        pieces.append(self.text[last_end:])
+        return pieces
+    
+    def save(self, config_path: Path) -> None:
+        """Write the rendered document atomically."""
+        _replace_file(config_path, self._pieces())
+
+def _file_signature(config_path: Path) -> Optional[Tuple[int, int, int]]:
+    """Return inode, size and modification time of a file, or None if it does not exist.
+
+    Every write replaces the file with a new inode, so an unchanged signature
+    means the file has not been written since it was read.
+    """
+    try:
+        st = os.stat(config_path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+def _replace_file(config_path: Path, pieces: Iterable[str]) -> None:
+    """Write a file through a temporary file renamed into place.
+
+    Readers and crashed runs see either the old or the new file, never a
+    partial one. A symlinked config (e.g. managed dotfiles) is written to its
+    target, and an existing file keeps its permissions; new files get the
+    usual permissions for the umask.
+    """
+    target = Path(os.path.realpath(config_path))
+    temp_path = target.parent / f".{target.name}.{secrets.token_hex(4)}.tmp"
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        with contextlib.suppress(FileNotFoundError):
+            os.chmod(temp_path, stat.S_IMODE(os.stat(target).st_mode))
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            f.writelines(pieces)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, target)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(temp_path)
+        raise
+
+def _try_lock(fd: int) -> bool:
+    """Take an exclusive advisory lock on an open file without blocking."""
+    try:
+        if os.name == "nt":
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+def _unlock(fd: int) -> None:
+    """Release a lock taken with _try_lock."""
+    if os.name == "nt":
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+@contextlib.contextmanager
+def lock_config_file(config_path: Path) -> Iterator[None]:
+    """Hold an exclusive lock on a config file for a read-modify-write.
+
+    The advisory lock is taken on a lock file next to the metadata sidecar,
+    not on the config itself, which is replaced on every write. Concurrent
+    runs poll with growing pauses for at most MCP_GEARBOX_LOCK_TIMEOUT
+    seconds and then fail with TimeoutError. Waits are recorded in
+    ``config_lock``.
+    """
+    lock_path = get_config_lock_path(config_path)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    timeout = _env_seconds("MCP_GEARBOX_LOCK_TIMEOUT", CONFIG_LOCK_TIMEOUT)
+    
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        started = time.monotonic()
+        attempts = 1
+        pause = 0.005
+        while not _try_lock(fd):
+            waited = time.monotonic() - started
+            if waited >= timeout:
+                _record_lock_wait(waited, attempts, timed_out=True)
+                raise TimeoutError(f"Timed out after {waited:.1f}s waiting for another mcp process to finish writing {config_path}")
+            time.sleep(min(pause, timeout - waited))
+            pause = min(pause * 2, CONFIG_LOCK_MAX_POLL)
+            attempts += 1
+        _record_lock_wait(time.monotonic() - started, attempts)
+        try:
+            yield
+        finally:
+            _unlock(fd)
+    finally:
+        os.close(fd)
+
+def _record_lock_wait(waited: float, attempts: int, timed_out: bool = False) -> None:
+    """Add one lock acquisition (or timeout) to the config_lock metrics."""
+    config_lock["acquisitions"] = config_lock.get("acquisitions", 0) + (0 if timed_out else 1)
+    config_lock["contended"] = config_lock.get("contended", 0) + (1 if attempts > 1 else 0)
+    config_lock["attempts"] = config_lock.get("attempts", 0) + attempts
+    config_lock["wait_ms"] = round(config_lock.get("wait_ms", 0) + waited * 1000, 1)
+    if timed_out:
+        config_lock["timed_out"] = True
+
+def _server_metadata(server: Dict[str, Any], mcp_key: str) -> Dict[str, Any]:
+    """Display metadata recorded for a configured server."""
+    metadata = {
+        'name': server['name'],
+        'by': server.get('by', 'Unknown'),
+        'stargazer_count': server.get('stargazer_count', 0),
+        'mcp_key': mcp_key,
+        'description': server.get('description', 'No description available')
+    }
+    if server.get('updated_at'):
+        metadata['updated_at'] = server['updated_at']
+    return metadata
+
+def resolve_server_metadata(configured_servers: List[str], available_servers: List[Dict[str, Any]], agent: str) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Look up configured server names in the catalog.
+
+    Names that are not in the catalog, or match several servers, map to None
+    so they are not looked up again on every run.
+    """
+    index = CatalogIndex(available_servers)
+    metadata = {}
+    for configured_name in configured_servers:
+        matches = index.find_configured(configured_name, agent)
+        metadata[configured_name] = _server_metadata(*matches[0]) if len(matches) == 1 else None
+    return metadata
+
+def match_configured_servers(configured_servers: List[str], metadata: Dict[str, Optional[Dict[str, Any]]], agent: str) -> List[Dict[str, Any]]:
+    """Build display entries for configured servers from recorded metadata.
+
+    Names without metadata get a basic entry derived from the name itself.
+    """
+    matched_servers = []
+    
+    for configured_name in configured_servers:
+        entry = metadata.get(configured_name)
+        if entry:
+            matched_servers.append({**entry, 'configured_name': configured_name})
+            continue
+        
+        # If no match found, create a basic entry with better defaults
+        # For copilot-cli, server names use hyphens instead of slashes
+        if agent == "copilot-cli":
+            name_parts = configured_name.split('-')
+        else:
+            name_parts = configured_name.split('/')
+        
+        if len(name_parts) > 1:
+            # Format: org-name or org/name - use org as 'by' field and name as server name
+            by_org = name_parts[0]
+            server_name = name_parts[-1].title()
+        else:
+            # Format: name - use the name as server name and 'Unknown' as org
+            by_org = 'Unknown'
+            server_name = configured_name.title()
+        
+        matched_servers.append({
+            'name': server_name,
+            'by': by_org,
+            'stargazer_count': 0,
+            'configured_name': configured_name,
+            'mcp_key': configured_name,
+            'description': 'No description available'
+        })
+    
+    return matched_servers
+
+def create_mcp_config(selected_servers: List[Dict[str, Any]], agent: str) -> Dict[str, Any]:
+    """Create MCP configuration from selected servers based on agent format."""
+    if agent == "copilot":
+        # GitHub Copilot format: {"servers": {...}, "inputs": []}
+        # Keep gallery and version fields for copilot
+        config = {"servers": {}, "inputs": []}
+        
+        for server in selected_servers:
+            mcp_config = server.get("mcp", {})
+            # Copy the internal server data exactly as it is for copilot
+            config["servers"].update(mcp_config)
+    elif agent == "copilot-cli":
+        # Copilot CLI format: {"mcpServers": {...}}
+        # For copilot-cli, we need different formats based on server type:
+        # - For stdio type: change to local type and format server name with hyphens
+        # - For http type: include headers field like {"headers": {"CONTEXT7_API_KEY": "YOUR_API_KEY"}}
+        config = {"mcpServers": {}}
+        
+        for server in selected_servers:
+            mcp_config = server.get("mcp", {})
+            for server_key, server_data in mcp_config.items():
+                # Clean the server configuration by removing gallery and version fields
+                cleaned_server_data = {k: v for k, v in server_data.items() if k not in ["gallery", "version"]}
+                
+                # Format server name with hyphens instead of slashes
+                formatted_server_key = server_key.replace("/", "-")
+                
+                # For copilot-cli, change stdio type to local and add tools field
+                if cleaned_server_data.get("type") == "stdio":
+                    cleaned_server_data["type"] = "local"
+                    if "tools" not in cleaned_server_data:
+                        cleaned_server_data["tools"] = ["*"]
+                elif cleaned_server_data.get("type") == "http":
+                    # For http type, add headers field if not present
+                    if "headers" not in cleaned_server_data:
+                        cleaned_server_data["headers"] = {}
+                    # Also add tools field for http type servers
+                    if "tools" not in cleaned_server_data:
+                        cleaned_server_data["tools"] = ["*"]
+                
+                config["mcpServers"][formatted_server_key] = cleaned_server_data
+    else:
+        # Continue, Kiro, Cursor, Qoder, LM Studio, Claude Agent and other agents format: {"mcpServers": {...}}
+        # Remove gallery and version fields for other agents
+        config = {"mcpServers": {}}
+        
+        for server in selected_servers:
+            mcp_config = server.get("mcp", {})
+            # Clean the server configuration by removing gallery and version fields
+            cleaned_config = {}
+            for server_key, server_data in mcp_config.items():
+                cleaned_server_data = {k: v for k, v in server_data.items() if k not in ["gallery", "version"]}
+                cleaned_config[server_key] = cleaned_server_data
+            config["mcpServers"].update(cleaned_config)
+    
+    return config
+
+def get_server_metadata_path(config_path: Path) -> Path:
+    """Return the sidecar file holding catalog metadata for a config file."""
+    digest = hashlib.sha256(str(Path(config_path).resolve()).encode()).hexdigest()[:16]
+    return Path(user_data_dir("mcp-gearbox", appauthor=False)) / "configs" / f"{digest}.json"
+
+def get_config_lock_path(config_path: Path) -> Path:
+    """Return the lock file serializing writes to a config file."""
+    return get_server_metadata_path(config_path).with_suffix(".lock")
+
+def load_server_metadata(config_path: Path) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Load the written key -> catalog metadata mapping recorded for a config file."""
+    try:
+        with open(get_server_metadata_path(config_path), 'r', encoding='utf-8') as f:
+            sidecar = json.load(f)
+        servers = sidecar["servers"]
+        return servers if isinstance(servers, dict) else {}
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}
+
+def save_server_metadata(config_path: Path, metadata: Dict[str, Optional[Dict[str, Any]]]) -> None:
+    """Record catalog metadata for a config file so list and rm can render offline."""
+    metadata_path = get_server_metadata_path(config_path)
+    try:
+        metadata_path.parent.mkdir(parents=True, exist_ok=True)
+        _write_json_atomic(metadata_path, {
+            "config_path": str(Path(config_path).resolve()),
+            "servers": metadata,
+        })
+    except OSError:
+        # The sidecar is only a cache; list and rm fall back to the catalog
+        pass
+
+def get_configured_server_metadata(config_path: Path, configured_servers: List[str], agent: str, catalogs: Optional[List[str]] = None, refresh: str = "blocking", github_token: Optional[str] = None, refresh_metadata: bool = False, json_output: bool = False) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Return display metadata for configured servers, loading the catalog only when needed.
+
+    Servers recorded in the sidecar are rendered from it; the catalog is only
+    loaded for names not seen before, or for all of them with
+    ``refresh_metadata``. Newly resolved names are merged into the sidecar
+    under the config lock, so entries recorded by a concurrent ``init`` are
+    kept; only ``rm`` prunes entries. The sidecar is only a cache: when the
+    lock cannot be taken it is left as it was.
+    """
+    metadata = {} if refresh_metadata else load_server_metadata(config_path)
+    missing = [name for name in configured_servers if name not in metadata]
+    if not missing:
+        return metadata
+    
+    available_servers = load_mcp_servers(catalogs, refresh=refresh, quiet=json_output, github_token=github_token)
+    if not available_servers:
+        if not json_output:
+            console.print("[yellow]Could not download server information. Using basic display.[/yellow]")
+        return metadata
+    
+    resolved = resolve_server_metadata(missing, available_servers, agent)
+    metadata.update(resolved)
+    try:
+        with lock_config_file(config_path):
+            sidecar = load_server_metadata(config_path)
+            for name, entry in resolved.items():
+                # Keep metadata a concurrent init recorded from a catalog this run lacks
+                if entry is not None or refresh_metadata or sidecar.get(name) is None:
+                    sidecar[name] = entry
+            save_server_metadata(config_path, sidecar)
+    except (OSError, TimeoutError):
+        # Another run holds the lock; the names are resolved again next time
+        pass
+    return metadata
+
+def save_mcp_config(config: Dict[str, Any], config_path: Path, agent: str, json_output: bool = False, selected_servers: Optional[List[Dict[str, Any]]] = None) -> bool:
+    """Save MCP configuration to the specified path, merging with existing entries.
+
+    Catalog metadata for ``selected_servers`` is recorded in a sidecar so
+    ``list`` and ``rm`` can render the configuration without the catalog.
+    """
+    try:
+        # Create directory if it doesn't exist
+        config_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        document = ConfigDocument()
+        
+        # Load existing configuration if it exists
+        if config_path.exists():
+            try:
+                document = ConfigDocument.load(config_path)
+                if not json_output:
+                    console.print(f"[yellow]Found existing configuration, merging entries...[/yellow]")
+            except Exception as e:
+                if not json_output:
+                    from rich.prompt import Confirm
+                    console.print(f"[yellow]Warning: Could not read existing config: {e}[/yellow]")
+                    if not Confirm.ask(f"Continue and merge the file?"):
+                        return False
+                else:
+                    # In JSON mode, just continue without prompting
+                    pass
+                # Merge over the unreadable file unless it changes before the lock is taken
+                document.signature = _file_signature(config_path)
+        
+        # GitHub Copilot keeps servers under "servers"; Copilot CLI, Continue, Kiro,
+        # Cursor, Qoder, LM Studio, Claude and the other agents under "mcpServers"
+        servers_key = "servers" if agent == "copilot" else "mcpServers"
+        
+        # Show what's being added
+        new_servers = list(config[servers_key].keys())
+        if not json_output:
+            console.print(f"[green]Adding {len(new_servers)} servers to existing configuration:[/green]")
+            for server in new_servers:
+                console.print(f"  • {server}")
+        
+        # The file was read (and any prompt answered) without the lock; re-read it
+        # only if another run has written it since
+        with lock_config_file(config_path):
+            if _file_signature(config_path) != document.signature:
+                document = ConfigDocument.load(config_path) if config_path.exists() else ConfigDocument()
+            
+            # Merge new servers with existing ones; only this member of the file is rewritten
+            document.set(servers_key, {**document.data.get(servers_key, {}), **config[servers_key]})
+            if agent == "copilot" and "inputs" not in document.data:
+                document.set("inputs", [])
+            
+            # Save merged configuration, unless every server was already configured as requested
+            if document.changed:
+                document.save(config_path)
+            
+            if selected_servers:
+                metadata = load_server_metadata(config_path)
+                for server in selected_servers:
+                    for mcp_key in server.get("mcp", {}):
+                        # Copilot CLI writes keys with hyphens instead of slashes
+                        written_key = mcp_key.replace("/", "-") if agent == "copilot-cli" else mcp_key
+                        metadata[written_key] = _server_metadata(server, mcp_key)
+                save_server_metadata(config_path, metadata)
+        
+        if not json_output:
+            console.print(f"[green]✓ MCP configuration saved to {config_path}[/green]")
+        return True
+        
+    except Exception as e:
+        if not json_output:
+            console.print(f"[red]Failed to save configuration: {str(e)}[/red]")
+        return False
+
+def load_existing_mcp_config(config_path: Path, agent: str, quiet: bool = False) -> Dict[str, Any]:
+    """Load existing MCP configuration from the specified path."""
+    if not config_path.exists():
+        return {}
+    
+    try:
+        with open(config_path, 'r') as f:
+            return json.load(f)
+    except Exception as e:
+        if not quiet:
+            console.print(f"[red]Error reading configuration: {e}[/red]")
+        return {}
+
+def list_configured_servers(config: Dict[str, Any], agent: str) -> List[str]:
+    """List all configured MCP servers from the configuration."""
+    if agent == "copilot":
+        return list(config.get("servers", {}).keys())
+    elif agent == "copilot-cli":
+        return list(config.get("mcpServers", {}).keys())
+    else:
+        return list(config.get("mcpServers", {}).keys())
+
+def remove_servers_from_config(config: Dict[str, Any], servers_to_remove: List[str], agent: str, quiet: bool = False) -> Tuple[Dict[str, Any], List[str], List[str]]:
+    """Remove specified servers from configuration. Returns updated config, removed servers, and not found servers."""
+    removed_servers = []
+    not_found_servers = []
+    
+    if agent == "copilot":
+        servers_dict = config.get("servers", {})
+    elif agent == "copilot-cli":
+        servers_dict = config.get("mcpServers", {})
+    else:
+        servers_dict = config.get("mcpServers", {})
+    
+    for server_name in servers_to_remove:
+        # First try exact match
+        if server_name in servers_dict:
+            del servers_dict[server_name]
+            removed_servers.append(server_name)
+        else:
+            # Try partial matching - look for servers that end with the given name
+            # This allows "fetch" to match "modelcontextprotocol/fetch" or "modelcontextprotocol-fetch" for copilot-cli
+            matches = []
+            for full_name in servers_dict.keys():
+                # Check if the server name ends with the given name (after a slash or hyphen)
+                if full_name.endswith('/' + server_name) or full_name.endswith('-' + server_name) or full_name == server_name:
+                    matches.append(full_name)
+            
+            if len(matches) == 1:
+                # Single match found, remove it
+                full_name = matches[0]
+                del servers_dict[full_name]
+                removed_servers.append(full_name)
+            elif len(matches) > 1:
+                # Multiple matches found, this is ambiguous
+                if not quiet:
+                    console.print(f"[yellow]Ambiguous server name '{server_name}'. Multiple matches found:[/yellow]")
+                    for match in matches:
+                        console.print(f"  • {match}")
+                    console.print(f"[yellow]Please use the full server name to specify which one to remove.[/yellow]")
+                not_found_servers.append(server_name)
+            else:
+                # No matches found
+                not_found_servers.append(server_name)
+    
+    return config, removed_servers, not_found_servers
+
+def remove_servers(config_path: Path, servers_to_remove: List[str], agent: str, quiet: bool = False) -> Tuple[List[str], List[str], List[str]]:
+    """Remove servers from a config file.
+
+    The file is read and written under the config lock. Only the servers
+    member is rewritten, and nothing is written when none of the servers were
+    found. Recorded metadata of removed servers is pruned from the sidecar.
+    Returns the removed, not found and remaining servers.
+    """
+    servers_key = "servers" if agent == "copilot" else "mcpServers"
+    with lock_config_file(config_path):
+        document = ConfigDocument.load(config_path)
+        servers = dict(document.data.get(servers_key, {}))
+        _, removed_servers, not_found_servers = remove_servers_from_config({servers_key: servers}, servers_to_remove, agent, quiet)
+        
+        if removed_servers:
+            document.set(servers_key, servers)
+            document.save(config_path)
+            
+            metadata = load_server_metadata(config_path)
+            if any(server in metadata for server in removed_servers):
+                save_server_metadata(config_path, {name: entry for name, entry in metadata.items() if name not in removed_servers})
+    
+    return removed_servers, not_found_servers, list(servers)
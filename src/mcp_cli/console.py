@@ -0,0 +1,75 @@
+"""Shared rich console and the ASCII art banner."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional, Any
+
+if TYPE_CHECKING:
+    from rich.console import Console, Group
+
+class _LazyConsole:
+    """Stand-in for the shared ``rich.console.Console``, created on first use.
+
+    Modules import this object once, so it stays in place and forwards every
+    attribute read and write to the real console, which is built on the first
+    access.
+    """
+    
+    _console: Optional[Console] = None
+    
+    def _load(self) -> Console:
+        if self._console is None:
+            from rich.console import Console
+            object.__setattr__(self, "_console", Console())
+        return self._console
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._load(), name)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._load(), name, value)
+
+console = _LazyConsole()
+
+def get_console() -> Console:
+    """Return the shared console itself, for rich objects that take a ``console`` argument.
+
+    rich uses the console as a context manager, which a forwarding stand-in
+    cannot provide.
+    """
+    return console._load()
+
+BANNER = r"""
+███╗   ███╗ ██████╗██████╗      ██████╗██╗     ██╗
+████╗ ████║██╔════╝██╔══██╗    ██╔════╝██║     ██║
+██╔████╔██║██║     ██████╔╝    ██║     ██║     ██║
+██║╚██╔╝██║██║     ██╔═══╝     ██║     ██║     ██║
+██║ ╚═╝ ██║╚██████╗██║         ╚██████╗███████╗██║
+╚═╝     ╚═╝ ╚═════╝╚═╝          ╚═════╝╚══════╝╚═╝
+"""
+
+TAGLINE = "Setup high-quality MCP servers faster"
+
+def banner() -> Group:
+    """Build the ASCII art banner."""
+    from rich.console import Group
+    from rich.text import Text
+    from rich.align import Align
+    
+    banner_lines = BANNER.strip().split('\n')
+    colors = ["dark_cyan", "cyan", "bright_cyan", "blue", "bright_blue", "light_blue"]
+
+    styled_banner = Text()
+    for i, line in enumerate(banner_lines):
+        color = colors[i % len(colors)]
+        styled_banner.append(line + "\n", style=color)
+
+    return Group(
+        Align.center(styled_banner),
+        Align.center(Text(TAGLINE, style="italic bright_yellow")),
+        Text()
+    )
+
+def show_banner():
+    """Display the ASCII art banner."""
+    console.print(banner())
@@ -0,0 +1,216 @@
+"""Machine output for ``--json``.
+
+Commands run with ``--json`` hand over to the functions here before any
+terminal output is prepared. Each one builds plain data and returns it, or
+raises ``JsonExit`` to stop early, and ``run_json`` prints the result as a
+single document. Nothing on this path imports rich or creates the console.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Callable, NoReturn
+
+import typer
+
+from .agents import AGENT_CONFIG, check_agent_installation, get_mcp_config_path
+from .catalog import load_mcp_servers, _network_metrics
+from .index import CatalogIndex, CatalogOrder, CatalogSearch, SEARCH_FIELDS
+from .config import config_lock, create_mcp_config, get_configured_server_metadata, list_configured_servers, load_existing_mcp_config, match_configured_servers, remove_servers, save_mcp_config
+
+# Built once and reused; ``encode`` serializes the whole document in one call
+# through the C encoder, which is faster than writing ``iterencode`` chunks
+_ENCODER = json.JSONEncoder()
+_PRETTY_ENCODER = json.JSONEncoder(indent=2)
+
+class JsonExit(Exception):
+    """Stop a headless command with ``data`` as its output and ``code`` as its exit status."""
+    
+    def __init__(self, data: Dict[str, Any], code: int = 1):
+        super().__init__(data.get("error") or data.get("message"))
+        self.data = data
+        self.code = code
+
+def emit_json(data: Any, pretty: bool = False) -> None:
+    """Write ``data`` to stdout as one JSON document."""
+    sys.stdout.write((_PRETTY_ENCODER if pretty else _ENCODER).encode(data) + "\n")
+
+def run_json(handler: Callable[..., Any], pretty: bool, **options: Any) -> NoReturn:
+    """Run a headless command, print its result or error and exit with its status."""
+    try:
+        data, code = handler(**options), 0
+    except JsonExit as stop:
+        data, code = stop.data, stop.code
+    emit_json(data, pretty)
+    raise typer.Exit(code)
+
+def _check_agent(agent: Optional[str]) -> str:
+    """Validate ``--agent``; there is no interactive selection to fall back on."""
+    if not agent:
+        raise JsonExit({"error": "Agent must be specified with --agent when using --json"})
+    if agent not in AGENT_CONFIG:
+        raise JsonExit({"error": f"Unknown agent: {agent}. Available: {', '.join(AGENT_CONFIG.keys())}"})
+    return agent
+
+def _project_path(project_path: Optional[str]) -> Optional[Path]:
+    """Resolve an existing ``--project`` directory, or None for the global configuration."""
+    if project_path is None:
+        return None
+    target_path = Path.cwd() if project_path == "." else Path.cwd() / project_path
+    if not target_path.exists():
+        raise JsonExit({"error": f"Project directory does not exist: {target_path}"})
+    return target_path
+
+def _catalog(catalogs: Optional[List[str]], refresh: str, github_token: Optional[str]) -> List[Dict[str, Any]]:
+    """Load the catalog without spinners or warnings."""
+    servers = load_mcp_servers(catalogs, refresh=refresh, quiet=True, github_token=github_token)
+    if not servers:
+        raise JsonExit({"error": "Failed to download MCP servers"})
+    return servers
+
+def list_json(agent: Optional[str], project_path: Optional[str], available_servers: bool, refresh: str, github_token: Optional[str], catalogs: Optional[List[str]], refresh_metadata: bool, sort: Optional[str]) -> Any:
+    """``mcp list --json``: the catalog, or the servers configured for an agent."""
+    if available_servers:
+        servers = _catalog(catalogs, refresh, github_token)
+        return CatalogOrder(servers).apply(servers, sort)
+    
+    target_path = _project_path(project_path)
+    agent = _check_agent(agent)
+    config_path = get_mcp_config_path(agent, target_path)
+    
+    existing_config = load_existing_mcp_config(config_path, agent, quiet=True)
+    if not existing_config:
+        raise JsonExit({"servers": [], "message": "No MCP configuration found"}, 0)
+    configured_servers = list_configured_servers(existing_config, agent)
+    if not configured_servers:
+        raise JsonExit({"servers": [], "message": "No MCP servers are currently configured"}, 0)
+    
+    metadata = get_configured_server_metadata(config_path, configured_servers, agent, catalogs, refresh, github_token, refresh_metadata, json_output=True)
+    matched_servers = match_configured_servers(configured_servers, metadata, agent)
+    return {
+        "agent": agent,
+        "agent_name": AGENT_CONFIG[agent]['name'],
+        "config_path": str(config_path),
+        "is_global": target_path is None,
+        "servers": CatalogOrder(matched_servers).apply(matched_servers, sort),
+        **_network_metrics()
+    }
+
+def search_json(query_text: str, fields: Optional[List[str]], limit: int, refresh: str, github_token: Optional[str], catalogs: Optional[List[str]]) -> Dict[str, Any]:
+    """``mcp search --json``: ranked matches with their scores."""
+    matches = CatalogSearch(_catalog(catalogs, refresh, github_token)).search(query_text, fields)
+    return {
+        "query": query_text,
+        "fields": fields or list(SEARCH_FIELDS),
+        "total_matches": len(matches),
+        "results": [{**server, "score": round(score, 4)} for server, score in matches[:limit]],
+        **_network_metrics()
+    }
+
+def rm_json(servers: Optional[List[str]], all_servers: bool, agent: Optional[str], project_path: Optional[str]) -> Dict[str, Any]:
+    """``mcp rm --json``: remove named servers, or all of them, without confirmation."""
+    target_path = _project_path(project_path)
+    agent = _check_agent(agent)
+    config_path = get_mcp_config_path(agent, target_path)
+    
+    existing_config = load_existing_mcp_config(config_path, agent, quiet=True)
+    if not existing_config:
+        raise JsonExit({"error": f"No MCP configuration found at: {config_path}"}, 0)
+    configured_servers = list_configured_servers(existing_config, agent)
+    if not configured_servers:
+        raise JsonExit({"error": "No MCP servers are currently configured"}, 0)
+    
+    if all_servers:
+        servers_to_remove = configured_servers
+    elif servers:
+        servers_to_remove = servers
+    else:
+        raise JsonExit({"error": "Interactive server selection not supported with --json. Specify servers to remove or use --all"})
+    
+    try:
+        removed_servers, not_found_servers, remaining_servers = remove_servers(config_path, servers_to_remove, agent, quiet=True)
+    except Exception as e:
+        raise JsonExit({"error": f"Failed to save configuration: {str(e)}", "config_lock": dict(config_lock) or None})
+    
+    return {
+        "agent": agent,
+        "agent_name": AGENT_CONFIG[agent]['name'],
+        "config_path": str(config_path),
+        "is_global": target_path is None,
+        "operation": "remove",
+        "requested_servers": servers_to_remove,
+        "removed_servers": removed_servers,
+        "not_found_servers": not_found_servers,
+        "remaining_servers": remaining_servers,
+        "total_removed": len(removed_servers),
+        "total_remaining": len(remaining_servers),
+        "config_lock": dict(config_lock) or None,
+        **_network_metrics()
+    }
+
+def check_json(agent: Optional[str]) -> Dict[str, Any]:
+    """``mcp check --json``: installation and configuration status per agent."""
+    if agent:
+        agents_to_check = {_check_agent(agent): AGENT_CONFIG[agent]}
+    else:
+        agents_to_check = AGENT_CONFIG
+    
+    results = [check_agent_installation(agent_key, agent_config) for agent_key, agent_config in agents_to_check.items()]
+    return {
+        "total_agents": len(results),
+        "installed_count": sum(1 for result in results if result["installed"]),
+        "configured_count": sum(1 for result in results if result["config_exists"]),
+        "agents": results
+    }
+
+def init_json(project_name: Optional[str], servers: Optional[List[str]], agent: Optional[str], refresh: str, github_token: Optional[str], catalogs: Optional[List[str]]) -> Dict[str, Any]:
+    """``mcp init --json``: add the servers named with ``--servers`` to an agent configuration.
+
+    Arguments are validated before the project directory is created or the
+    catalog is loaded.
+    """
+    agent = _check_agent(agent)
+    if not servers:
+        raise JsonExit({"error": "Interactive server selection not supported with --json. Specify servers with --servers"})
+    
+    project_path = None
+    if project_name is not None:
+        project_path = Path.cwd() if project_name == "." else Path.cwd() / project_name
+        project_path.mkdir(parents=True, exist_ok=True)
+    
+    # Accept both -s git -s filesystem and -s "git filesystem"
+    catalog_index = CatalogIndex(_catalog(catalogs, refresh, github_token))
+    selected_servers, not_found_servers, ambiguous_servers = catalog_index.resolve([name for spec in servers for name in spec.split()])
+    if not_found_servers:
+        error = {
+            "error": f"Could not find servers: {', '.join(not_found_servers)}",
+            "suggestions": {server_name: catalog_index.suggest(server_name) for server_name in not_found_servers}
+        }
+        if ambiguous_servers:
+            error["ambiguous_servers"] = ambiguous_servers
+        raise JsonExit(error)
+    if ambiguous_servers:
+        raise JsonExit({"error": f"Ambiguous servers: {', '.join(ambiguous_servers)}", "ambiguous_servers": ambiguous_servers})
+    
+    config_path = get_mcp_config_path(agent, project_path)
+    if not save_mcp_config(create_mcp_config(selected_servers, agent), config_path, agent, True, selected_servers):
+        raise JsonExit({"error": "Failed to save configuration", "success": False, "config_lock": dict(config_lock) or None})
+    
+    output_data = {
+        "agent": agent,
+        "agent_name": AGENT_CONFIG[agent]['name'],
+        "config_path": str(config_path),
+        "is_global": project_path is None,
+        "operation": "init",
+        "servers_added": [s["name"] for s in selected_servers],
+        "total_servers": len(selected_servers),
+        "success": True,
+        "config_lock": dict(config_lock) or None,
+        **_network_metrics()
+    }
+    if project_path is not None:
+        output_data["project_name"] = project_name
+        output_data["project_path"] = str(project_path)
+    return output_data
@@ -0,0 +1,570 @@
+"""In-memory indexes over the catalog: lookup, suggestions, search, filtering and sort orders."""
+
+from __future__ import annotations
+
+import bisect
+import functools
+import itertools
+import math
+import re
+from collections import defaultdict
+from typing import Optional, Tuple, List, Dict, Any
+
+SEARCH_FIELDS = ("name", "by", "key", "description")
+
+SORT_MODES = ("stars", "name", "org", "updated")
+
+def _edit_distance(a: str, b: str) -> int:
+    """Levenshtein distance using Myers' bit-parallel algorithm (one pass over ``b``)."""
+    if not a or not b:
+        return len(a) or len(b)
+    
+    # Bit i of match[c] is set when a[i] == c
+    match: Dict[str, int] = {}
+    for i, ch in enumerate(a):
+        match[ch] = match.get(ch, 0) | (1 << i)
+    
+    full = (1 << len(a)) - 1
+    last = 1 << (len(a) - 1)
+    positive, negative, distance = full, 0, len(a)
+    for ch in b:
+        eq = match.get(ch, 0)
+        xv = eq | negative
+        xh = (((eq & positive) + positive) ^ positive) | eq
+        horizontal_positive = negative | ~(xh | positive)
+        horizontal_negative = positive & xh
+        if horizontal_positive & last:
+            distance += 1
+        elif horizontal_negative & last:
+            distance -= 1
+        horizontal_positive = (horizontal_positive << 1) | 1
+        horizontal_negative <<= 1
+        positive = (horizontal_negative | ~(xv | horizontal_positive)) & full
+        negative = horizontal_positive & xv & full
+    return distance
+
+class SuggestionIndex:
+    """Symmetric-delete index for finding terms within a small edit distance.
+
+    Every term is stored under each string obtained by deleting up to
+    ``max_distance`` of the characters in its first ``prefix_length``
+    characters. Two strings within edit distance k have prefixes within
+    distance k that share such a variant, so a lookup only generates the
+    query's own variants, collects the terms stored under them with dict
+    lookups, and computes the exact distance for those few candidates.
+    Lookup cost does not depend on the number of terms, and the prefix
+    keeps the build cheap for long keys.
+    """
+    
+    def __init__(self, terms: List[str], max_distance: int = 2, prefix_length: int = 7):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self._variants: Dict[str, List[str]] = defaultdict(list)
+        for term in dict.fromkeys(terms):
+            for variant in self._deletions(term[:prefix_length], max_distance):
+                self._variants[variant].append(term)
+        self._variants = dict(self._variants)
+    
+    @staticmethod
+    def _deletions(term: str, distance: int) -> set:
+        """Return ``term`` and every string obtained by deleting up to ``distance`` characters."""
+        variants = {term}
+        frontier = {term}
+        for _ in range(distance):
+            frontier = {word[:i] + word[i + 1:] for word in frontier for i in range(len(word))}
+            variants |= frontier
+        return variants
+    
+    def find(self, query: str, tolerance: int) -> List[Tuple[int, str]]:
+        """Return ``(distance, term)`` pairs within ``tolerance`` of ``query``, closest first."""
+        tolerance = min(tolerance, self.max_distance)
+        candidates = set()
+        for variant in self._deletions(query[:self.prefix_length], tolerance):
+            candidates.update(self._variants.get(variant, ()))
+        matches = []
+        for term in candidates:
+            distance = _edit_distance(query, term)
+            if distance <= tolerance:
+                matches.append((distance, term))
+        matches.sort()
+        return matches
+
+class CatalogIndex:
+    """Hash index over a server catalog for constant-time lookups.
+
+    Built once per catalog load and shared by ``init``, ``list`` and ``rm``.
+    Servers can be found by display name (case-insensitive), full mcp key,
+    copilot-cli hyphenated key or trailing key segment. Lookups return every
+    candidate ``(server, mcp_key)`` pair, so callers can tell an unknown name
+    (no candidates) from an ambiguous one (several servers).
+    """
+    
+    def __init__(self, servers: List[Dict[str, Any]]):
+        self.servers = servers
+        self._by_name: Dict[str, List[Tuple[int, str]]] = {}
+        self._by_key: Dict[str, Tuple[int, str]] = {}
+        self._by_hyphen_key: Dict[str, Tuple[int, str]] = {}
+        self._by_segment: Dict[str, List[Tuple[int, str]]] = {}
+        
+        self._suggestions: Optional[SuggestionIndex] = None
+        
+        for index, server in enumerate(servers):
+            mcp_keys = list(server.get("mcp", {}).keys())
+            if mcp_keys:
+                self._by_name.setdefault(server.get("name", "").lower(), []).append((index, mcp_keys[0]))
+            for mcp_key in mcp_keys:
+                self._by_key.setdefault(mcp_key, (index, mcp_key))
+                self._by_hyphen_key.setdefault(mcp_key.replace("/", "-"), (index, mcp_key))
+                if "/" in mcp_key:
+                    self._by_segment.setdefault(mcp_key.rsplit("/", 1)[-1], []).append((index, mcp_key))
+    
+    def _candidates(self, entries: List[Tuple[int, str]]) -> List[Tuple[Dict[str, Any], str]]:
+        """Resolve index entries to servers, one candidate per distinct server."""
+        seen = set()
+        candidates = []
+        for index, mcp_key in entries:
+            if index not in seen:
+                seen.add(index)
+                candidates.append((self.servers[index], mcp_key))
+        return candidates
+    
+    def find(self, name: str) -> List[Tuple[Dict[str, Any], str]]:
+        """Find servers requested by name (e.g. ``init --servers``).
+
+        Tries the display name, the full mcp key, the copilot-cli hyphenated
+        key and finally the trailing key segment.
+        """
+        if name.lower() in self._by_name:
+            return self._candidates(self._by_name[name.lower()])
+        if name in self._by_key:
+            return self._candidates([self._by_key[name]])
+        if name in self._by_hyphen_key:
+            return self._candidates([self._by_hyphen_key[name]])
+        return self._candidates(self._by_segment.get(name.split("/")[-1], []))
+    
+    def resolve(self, names: List[str]) -> Tuple[List[Dict[str, Any]], List[str], Dict[str, List[str]]]:
+        """Resolve requested names to servers.
+
+        Returns the selected servers, the names that were not found and the
+        ambiguous names with the mcp keys they match.
+        """
+        selected_servers = []
+        not_found_servers = []
+        ambiguous_servers = {}
+        for name in names:
+            matches = self.find(name)
+            if len(matches) == 1:
+                selected_servers.append(matches[0][0])
+            elif matches:
+                ambiguous_servers[name] = [mcp_key for _, mcp_key in matches]
+            else:
+                not_found_servers.append(name)
+        return selected_servers, not_found_servers, ambiguous_servers
+    
+    def suggest(self, name: str, limit: int = 3) -> List[str]:
+        """Suggest catalog names close to a name that was not found.
+
+        Candidates are lowercase display names and trailing key segments, the
+        forms ``find`` accepts. The index is built on the first miss.
+        """
+        if self._suggestions is None:
+            self._suggestions = SuggestionIndex(sorted(set(self._by_name) | set(self._by_segment)))
+        query = name.lower().split("/")[-1]
+        # One edit for very short names, two otherwise
+        tolerance = 1 if len(query) < 3 else 2
+        return [term for _, term in self._suggestions.find(query, tolerance)[:limit]]
+    
+    def find_configured(self, configured_name: str, agent: str) -> List[Tuple[Dict[str, Any], str]]:
+        """Find the catalog entry for a server name read from an agent's config file."""
+        if configured_name in self._by_key:
+            return self._candidates([self._by_key[configured_name]])
+        if agent == "copilot-cli":
+            # Copilot CLI stores keys with hyphens instead of slashes
+            if configured_name in self._by_hyphen_key:
+                return self._candidates([self._by_hyphen_key[configured_name]])
+            if "/" in configured_name or "-" not in configured_name:
+                return []
+            configured_name = configured_name.replace("-", "/")
+        return self._candidates(self._by_segment.get(configured_name.split("/")[-1], []))
+
+class CatalogSearch:
+    """Inverted index over a catalog for ``mcp search``.
+
+    Every field (name, author, mcp key, description) has its own postings of
+    term -> {server: term frequency}. Queries are scored with BM25 per field,
+    weighted by field, and blended with the server's star count. A query
+    term missing from the vocabulary falls back to the terms it prefixes.
+    """
+    
+    field_weights = {"name": 3.0, "key": 2.0, "by": 1.5, "description": 1.0}
+    k1 = 1.2
+    b = 0.75
+    # How much log10(stars) boosts relevance (e.g. 10k stars -> x1.4)
+    star_weight = 0.1
+    max_prefix_terms = 50
+    
+    def __init__(self, servers: List[Dict[str, Any]]):
+        self.servers = servers
+        self._postings: Dict[str, Dict[str, Dict[int, int]]] = {field: {} for field in self.field_weights}
+        self._lengths: Dict[str, List[int]] = {field: [] for field in self.field_weights}
+        
+        for index, server in enumerate(servers):
+            for field in self.field_weights:
+                terms = _search_words(self._field_text(server, field))
+                self._lengths[field].append(len(terms))
+                postings = self._postings[field]
+                for term in terms:
+                    docs = postings.setdefault(term, {})
+                    docs[index] = docs.get(index, 0) + 1
+        
+        self._average_lengths = {
+            field: (sum(lengths) / len(lengths) if lengths else 0.0) or 1.0
+            for field, lengths in self._lengths.items()
+        }
+        self._vocabulary = sorted({term for postings in self._postings.values() for term in postings})
+    
+    @staticmethod
+    def _field_text(server: Dict[str, Any], field: str) -> str:
+        if field == "key":
+            return " ".join(server.get("mcp", {}).keys())
+        return str(server.get(field) or "")
+    
+    def _expand(self, term: str) -> List[str]:
+        """Return the indexed terms a query term matches: itself, or the terms it prefixes."""
+        start = bisect.bisect_left(self._vocabulary, term)
+        if start < len(self._vocabulary) and self._vocabulary[start] == term:
+            return [term]
+        expansions = []
+        for candidate in itertools.islice(self._vocabulary, start, start + self.max_prefix_terms):
+            if not candidate.startswith(term):
+                break
+            expansions.append(candidate)
+        return expansions
+    
+    def _term_scores(self, term: str, fields: List[str]) -> Dict[int, float]:
+        """BM25 scores of one indexed term, summed over the searched fields."""
+        total = len(self.servers)
+        scores: Dict[int, float] = {}
+        for field in fields:
+            docs = self._postings[field].get(term)
+            if not docs:
+                continue
+            idf = math.log(1 + (total - len(docs) + 0.5) / (len(docs) + 0.5))
+            weight = self.field_weights[field] * idf
+            lengths = self._lengths[field]
+            average = self._average_lengths[field]
+            for index, frequency in docs.items():
+                norm = frequency + self.k1 * (1 - self.b + self.b * lengths[index] / average)
+                scores[index] = scores.get(index, 0.0) + weight * frequency * (self.k1 + 1) / norm
+        return scores
+    
+    def search(self, query: str, fields: Optional[List[str]] = None) -> List[Tuple[Dict[str, Any], float]]:
+        """Return ``(server, score)`` pairs matching any query term, best first."""
+        fields = list(fields or self.field_weights)
+        relevance: Dict[int, float] = {}
+        
+        for query_term in dict.fromkeys(_search_words(query)):
+            # A query term counts once per server, through its best expansion
+            best: Dict[int, float] = {}
+            for term in self._expand(query_term):
+                for index, score in self._term_scores(term, fields).items():
+                    if score > best.get(index, 0.0):
+                        best[index] = score
+            for index, score in best.items():
+                relevance[index] = relevance.get(index, 0.0) + score
+        
+        ranked = []
+        for index, score in relevance.items():
+            stars = self.servers[index].get("stargazer_count") or 0
+            ranked.append((-score * (1 + self.star_weight * math.log10(1 + stars)), index))
+        ranked.sort()
+        return [(self.servers[index], -score) for score, index in ranked]
+
+class CatalogOrder:
+    """Sort orders over a server list for ``--sort`` and the selectors.
+
+    The sort keys of every mode are extracted once per catalog. Each mode's
+    order is a permutation of server indices, built on first use, and its
+    inverse ranks every server, so ordering a filtered subset compares
+    integers instead of re-reading the server dicts.
+    """
+    
+    # Modes listed best-first: most stars, most recently updated
+    descending = ("stars", "updated")
+    
+    def __init__(self, servers: List[Dict[str, Any]]):
+        names = [str(server.get('name') or '').casefold() for server in servers]
+        self._keys: Dict[str, List[Any]] = {
+            "stars": [server.get('stargazer_count') or 0 for server in servers],
+            "name": names,
+            "org": [(str(server.get('by') or '').casefold(), name) for server, name in zip(servers, names)],
+            # ISO 8601 timestamps sort chronologically; servers without one sort last
+            "updated": [str(server.get('updated_at') or '') for server in servers],
+        }
+        self._orders: Dict[str, List[int]] = {}
+        self._ranks: Dict[str, List[int]] = {}
+    
+    def permutation(self, mode: str) -> List[int]:
+        """Server indices in ``mode`` order; ties keep the catalog order."""
+        order = self._orders.get(mode)
+        if order is None:
+            keys = self._keys[mode]
+            order = self._orders[mode] = sorted(range(len(keys)), key=keys.__getitem__, reverse=mode in self.descending)
+        return order
+    
+    def rank(self, mode: str) -> List[int]:
+        """Position of every server in ``mode`` order."""
+        ranks = self._ranks.get(mode)
+        if ranks is None:
+            ranks = self._ranks[mode] = [0] * len(self._keys[mode])
+            for position, index in enumerate(self.permutation(mode)):
+                ranks[index] = position
+        return ranks
+    
+    def sort(self, indices: List[int], mode: Optional[str]) -> List[int]:
+        """Order a subset of server indices by ``mode``; None keeps the given order."""
+        if mode is None:
+            return indices
+        if len(indices) == len(self._keys[mode]):
+            return self.permutation(mode)
+        return sorted(indices, key=self.rank(mode).__getitem__)
+    
+    def apply(self, servers: List[Dict[str, Any]], mode: Optional[str]) -> List[Dict[str, Any]]:
+        """Return the servers this order was built from in ``mode`` order."""
+        if mode is None:
+            return servers
+        return [servers[index] for index in self.permutation(mode)]
+
+def _search_words(text: str) -> List[str]:
+    """Split text into lowercase words, breaking camelCase (``GitHub`` -> ``git``, ``hub``)."""
+    return [word.lower() for word in re.findall(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+", text)]
+
+@functools.lru_cache(maxsize=None)
+def _word_trigrams(word: str) -> frozenset:
+    """Return the trigrams of a word padded with two leading and one trailing space."""
+    padded = f"  {word} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+def _trigrams(words: List[str]) -> set:
+    """Return the padded trigrams of a list of words."""
+    grams = set()
+    for word in words:
+        grams |= _word_trigrams(word)
+    return grams
+
+def _is_subsequence(query: str, text: str) -> bool:
+    """Check whether the characters of ``query`` appear in ``text`` in order."""
+    chars = iter(text)
+    return all(ch in chars for ch in query)
+
+class ServerFilter:
+    """Fuzzy search filter used by the server selection screens.
+
+    The index is built once per catalog. Queries of three or more characters
+    are matched through a trigram index over name, mcp key, author and
+    description. This tolerates typos and swapped letters, ranks results by
+    weighted trigram overlap plus a bonus for exact substrings, and only
+    touches the postings of the query's trigrams. Shorter queries match word starts, or a
+    subsequence of the name starting at a word (``gh`` finds GitHub). They
+    narrow the previous result as more characters are typed.
+
+    ``indices`` maps each filtered position straight to the server's
+    original index. Results are kept for every prefix of the current query,
+    so Backspace reuses a stored one.
+    """
+    
+    # Trigram weights per field, in order of importance
+    field_weights = (("name", 3.0), ("key", 2.0), ("by", 2.0), ("description", 1.0))
+    # Share of the query's trigrams (other than those padded at the start) a
+    # server, or for one-word queries one of its words, must contain to match
+    min_overlap = 0.4
+    # One-word queries up to this length are also matched with two adjacent
+    # letters swapped, at this share of the score
+    transposition_length = 6
+    transposition_weight = 0.5
+    
+    def __init__(self, servers: List[Dict[str, Any]]):
+        self.servers = servers
+        self._all = list(range(len(servers)))
+        self._results: Dict[str, List[int]] = {}
+        self.indices = self._all
+        
+        self._names: List[str] = []
+        self._initials: List[str] = []
+        self._words: List[set] = []
+        self._texts: List[Dict[str, str]] = []
+        self._by_initial: Dict[str, List[int]] = {}
+        postings: Dict[str, List[Tuple[int, float]]] = defaultdict(list)
+        word_servers: Dict[str, Dict[int, float]] = defaultdict(dict)
+        
+        for index, server in enumerate(servers):
+            # Catalogs may hold null fields, so read them as CatalogSearch does
+            keys = list(server.get("mcp", {}).keys()) or [str(server.get("mcp_key") or "")]
+            fields = {
+                "name": str(server.get("name") or ""),
+                "key": " ".join(keys),
+                "by": str(server.get("by") or ""),
+                "description": str(server.get("description") or ""),
+            }
+            name_words = _search_words(fields["name"])
+            self._names.append(fields["name"].lower())
+            self._initials.append("".join(word[0] for word in name_words))
+            self._words.append(set(name_words + _search_words(fields["key"]) + _search_words(fields["by"])))
+            self._texts.append({field: text.lower() for field, text in fields.items()})
+            for initial in {word[0] for word in self._words[-1]}:
+                self._by_initial.setdefault(initial, []).append(index)
+            
+            # Each trigram and word is posted once per server with the weight of
+            # its best field: fields are applied from least to most important
+            weights: Dict[str, float] = {}
+            for field, weight in reversed(self.field_weights):
+                field_words = _search_words(fields[field])
+                weights.update(dict.fromkeys(_trigrams(field_words), weight))
+                for word in field_words:
+                    word_servers[word][index] = weight
+            for gram, weight in weights.items():
+                postings[gram].append((index, weight))
+        
+        self._postings = dict(postings)
+        self._word_servers = dict(word_servers)
+        # Trigram index over the catalog's vocabulary for one-word queries
+        word_postings: Dict[str, List[str]] = defaultdict(list)
+        for word in self._word_servers:
+            for gram in _word_trigrams(word):
+                word_postings[gram].append(word)
+        self._word_postings = dict(word_postings)
+    
+    def __len__(self) -> int:
+        return len(self.indices)
+    
+    def _short_matches(self, query: str, base: List[int]) -> List[int]:
+        """Match one- or two-character queries against word starts and name subsequences."""
+        matches = []
+        for index in base:
+            if self._names[index].startswith(query):
+                rank = 0
+            elif self._initials[index].startswith(query):
+                rank = 1
+            elif any(word.startswith(query) for word in self._words[index]):
+                rank = 2
+            elif query[0] in self._initials[index] and _is_subsequence(query, self._names[index]):
+                rank = 3
+            else:
+                continue
+            matches.append((rank, index))
+        matches.sort()
+        return [index for _, index in matches]
+    
+    def _overlap_needed(self, grams: set) -> int:
+        """Number of the query's trigrams not padded at the start that a match has to share."""
+        return max(1, math.ceil(sum(gram[0] != " " for gram in grams) * self.min_overlap))
+    
+    def _trigram_scores(self, words: List[str]) -> Dict[int, float]:
+        """Score servers by the weighted trigrams they share with a query of several words."""
+        grams = _trigrams(words)
+        scores: Dict[int, float] = {}
+        hits: Dict[int, int] = {}
+        inner = set()
+        for gram in grams:
+            postings = self._postings.get(gram, ())
+            for index, weight in postings:
+                scores[index] = scores.get(index, 0.0) + weight
+            if gram[0] != " ":
+                for index, _ in postings:
+                    hits[index] = hits.get(index, 0) + 1
+                if gram[-1] != " ":
+                    inner.update(index for index, _ in postings)
+        
+        needed = self._overlap_needed(grams)
+        return {index: score for index, score in scores.items() if hits.get(index, 0) >= needed and index in inner}
+    
+    def _word_scores(self, query: str, same_start: bool = False) -> Dict[int, float]:
+        """Score servers by their best word sharing enough trigrams with a one-word query.
+
+        With ``same_start`` only words starting with the query's first letter
+        count.
+        """
+        grams = _word_trigrams(query)
+        shared: Dict[str, int] = {}
+        hits: Dict[str, int] = {}
+        inner: Dict[str, int] = {}
+        for gram in grams:
+            leading = gram[0] == " "
+            interior = not leading and gram[-1] != " "
+            for word in self._word_postings.get(gram, ()):
+                shared[word] = shared.get(word, 0) + 1
+                hits[word] = hits.get(word, 0) + (not leading)
+                inner[word] = inner.get(word, 0) + interior
+        
+        needed = self._overlap_needed(grams)
+        scores: Dict[int, float] = {}
+        for word, count in shared.items():
+            if hits[word] < needed or not inner[word] or (same_start and word[0] != query[0]):
+                continue
+            for index, weight in self._word_servers[word].items():
+                if count * weight > scores.get(index, 0.0):
+                    scores[index] = count * weight
+        return scores
+    
+    def _fuzzy_matches(self, query: str) -> List[int]:
+        """Rank servers by weighted trigram overlap with the query.
+
+        Trigrams padded at the start only say which letters a word starts
+        with, so they add to the score but not to the overlap a match needs;
+        at least one fully interior trigram has to match, and a one-word query
+        has to match within a single word. Short one-word queries share few
+        trigrams with a word whose letters they swap (``gti``), so they are
+        also matched against words with the same first letter after swapping
+        each pair of adjacent letters, ranking below direct matches.
+        """
+        words = _search_words(query)
+        if not words:
+            return []
+        if len(words) > 1:
+            scores = self._trigram_scores(words)
+        else:
+            word = words[0]
+            scores = self._word_scores(word)
+            if len(word) <= self.transposition_length:
+                for i in range(len(word) - 1):
+                    if word[i] == word[i + 1]:
+                        continue
+                    swapped = word[:i] + word[i + 1] + word[i] + word[i + 2:]
+                    for index, score in self._word_scores(swapped, same_start=True).items():
+                        scores[index] = max(scores.get(index, 0.0), score * self.transposition_weight)
+        
+        bonus = len(_trigrams(words))
+        ranked = []
+        for index, score in scores.items():
+            texts = self._texts[index]
+            # Exact substrings outrank fuzzy matches, weighted by field
+            for field, weight in self.field_weights:
+                if query in texts[field]:
+                    score += weight * bonus
+                    break
+            ranked.append((-score, index))
+        ranked.sort()
+        return [index for _, index in ranked]
+    
+    def set_query(self, query: str) -> None:
+        """Filter and rank servers matching ``query`` (case-insensitive)."""
+        query = query.lower().strip()
+        if not query:
+            self._results.clear()
+            self.indices = self._all
+            return
+        
+        if query not in self._results:
+            if len(query) < 3:
+                # Every short match starts at a word, so only servers with a word
+                # starting with the first character are candidates; a longer
+                # query narrows the result of the shorter one it extends
+                base = self._results.get(query[:-1]) or self._by_initial.get(query[0], [])
+                self._results[query] = self._short_matches(query, base)
+            else:
+                self._results[query] = self._fuzzy_matches(query)
+        
+        # Only prefixes of the current query can be reused
+        for key in [key for key in self._results if not query.startswith(key)]:
+            del self._results[key]
+        self.indices = self._results[query]
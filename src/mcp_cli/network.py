@@ -0,0 +1,129 @@
+"""Pooled HTTP client, TLS context and GitHub rate limit bookkeeping."""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import importlib.util
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Optional, Dict, Any
+
+from . import __version__
+
+if TYPE_CHECKING:
+    import ssl
+    import httpx
+
+HTTP_CONNECT_TIMEOUT = 10.0  # Seconds; override with MCP_GEARBOX_CONNECT_TIMEOUT
+HTTP_READ_TIMEOUT = 30.0  # Seconds; override with MCP_GEARBOX_READ_TIMEOUT
+
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=None)
+def get_ssl_context() -> ssl.SSLContext:
+    """Return the TLS context backed by the operating system's trust store, built on first use."""
+    import ssl
+    import truststore
+    return truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+
+def _env_seconds(name: str, default: float) -> float:
+    """Read a non-negative number of seconds from an environment variable."""
+    value = os.getenv(name, "").strip()
+    if value:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+    return default
+
+def get_http_client() -> httpx.Client:
+    """Return the process-wide pooled HTTP client, creating it on first use.
+
+    Every network request goes through this client so TLS sessions and
+    keep-alive connections are reused, including the redirect from GitHub to
+    the release CDN. HTTP/2 is negotiated when the h2 package is installed.
+    """
+    import httpx
+    
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = httpx.Client(
+                verify=get_ssl_context(),
+                http2=importlib.util.find_spec("h2") is not None,
+                follow_redirects=True,
+                timeout=httpx.Timeout(
+                    _env_seconds("MCP_GEARBOX_READ_TIMEOUT", HTTP_READ_TIMEOUT),
+                    connect=_env_seconds("MCP_GEARBOX_CONNECT_TIMEOUT", HTTP_CONNECT_TIMEOUT),
+                ),
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=30.0),
+                headers={"User-Agent": f"mcp-gearbox/{__version__}"},
+            )
+        return _http_client
+
+@atexit.register
+def _close_http_client() -> None:
+    """Close the pooled client at exit, if one was created.
+
+    Registered at import so that exit handlers registered later (such as the
+    wait for a background catalog refresh) run while the client is still open.
+    """
+    if _http_client is not None:
+        _http_client.close()
+
+def _github_token(cli_token: str | None = None) -> str | None:
+    """Return sanitized GitHub token (cli arg takes precedence) or None."""
+    return ((cli_token or os.getenv("GH_TOKEN") or os.getenv("GITHUB_TOKEN") or "").strip()) or None
+
+def _github_auth_headers(cli_token: str | None = None) -> dict:
+    """Return Authorization header dict only when a non-empty token exists."""
+    token = _github_token(cli_token)
+    return {"Authorization": f"Bearer {token}"} if token else {}
+
+GITHUB_MAX_BACKOFF = 10.0  # Longest rate-limit wait in seconds before giving up on a request
+# Hosts whose rate limits apply to the GitHub quota; mirrors and the release
+# CDN (objects.githubusercontent.com) do not count against it
+GITHUB_HOSTS = ("github.com", "api.github.com")
+
+# Last X-RateLimit-* values reported by GitHub in this process (exposed in --json output)
+github_rate_limit: Dict[str, Any] = {}
+
+def _int_header(response: httpx.Response, name: str) -> int | None:
+    """Return an integer response header, or None when missing or malformed."""
+    try:
+        return int(response.headers[name])
+    except (KeyError, ValueError):
+        return None
+
+def _is_github_url(url: httpx.URL | str) -> bool:
+    """Check whether a URL points at GitHub itself rather than a mirror or CDN."""
+    import httpx
+    return httpx.URL(url).host in GITHUB_HOSTS
+
+def _record_github_rate_limit(response: httpx.Response) -> None:
+    """Remember the rate-limit headers of a GitHub response and of the GitHub redirects leading to it."""
+    for hop in (*response.history, response):
+        if not _is_github_url(hop.url):
+            continue
+        remaining = _int_header(hop, "X-RateLimit-Remaining")
+        if remaining is not None:
+            github_rate_limit.update({
+                "limit": _int_header(hop, "X-RateLimit-Limit"),
+                "remaining": remaining,
+                "reset": _int_header(hop, "X-RateLimit-Reset"),
+            })
+
+def _github_rate_limit_delay(response: httpx.Response) -> float | None:
+    """Return how many seconds GitHub asks us to wait, or None when the response is not a rate-limited GitHub response."""
+    if response.status_code not in (403, 429) or not _is_github_url(response.url):
+        return None
+    retry_after = _int_header(response, "Retry-After")
+    if retry_after is not None:
+        return float(max(retry_after, 0))
+    if _int_header(response, "X-RateLimit-Remaining") == 0:
+        reset = _int_header(response, "X-RateLimit-Reset") or 0
+        return max(reset - time.time(), 0.0)
+    return None
@@ -0,0 +1,29 @@
+"""Validation callbacks for options shared by several commands."""
+
+from __future__ import annotations
+
+from typing import Optional, List
+
+import typer
+
+from .catalog import REFRESH_MODES
+from .index import SEARCH_FIELDS, SORT_MODES
+
+def search_fields_callback(value: Optional[List[str]]) -> Optional[List[str]]:
+    """Validate the --field options of ``mcp search``."""
+    for field in value or []:
+        if field not in SEARCH_FIELDS:
+            raise typer.BadParameter(f"must be one of: {', '.join(SEARCH_FIELDS)}")
+    return value
+
+def sort_callback(value: Optional[str]) -> Optional[str]:
+    """Validate the --sort option."""
+    if value is not None and value not in SORT_MODES:
+        raise typer.BadParameter(f"must be one of: {', '.join(SORT_MODES)}")
+    return value
+
+def refresh_callback(value: str) -> str:
+    """Validate the --refresh option."""
+    if value not in REFRESH_MODES:
+        raise typer.BadParameter(f"must be one of: {', '.join(REFRESH_MODES)}")
+    return value
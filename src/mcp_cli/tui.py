@@ -0,0 +1,678 @@
+"""Interactive agent and server selectors.
+
+Only imported by interactive runs, so ``--json`` invocations never load
+readchar, ``rich.live`` or the selector code.
+"""
+
+from __future__ import annotations
+
+import codecs
+import os
+import select
+import sys
+import time
+from typing import TYPE_CHECKING, Optional, Tuple, List, Dict, Any
+
+from .console import banner, console, get_console
+from .agents import AGENT_CONFIG
+from .index import CatalogOrder, ServerFilter, SORT_MODES
+from .config import match_configured_servers
+
+if TYPE_CHECKING:
+    from rich.console import Group
+    from rich.panel import Panel
+
+class KeyReader:
+    """Read key presses in batches for the interactive selectors.
+
+    ``read()`` blocks for the first key press, then keeps collecting input
+    that arrives within one frame budget. A paste or a held key therefore
+    yields one batch, and the selector filters and redraws once per batch
+    instead of once per key. On POSIX terminals the reader holds cbreak mode
+    for its whole lifetime and splits escape sequences the same way readchar
+    does. On Windows it drains the console input buffer. Anywhere else (e.g.
+    when stdin is not a terminal) it falls back to one ``readchar.readkey()``
+    per batch.
+    """
+    
+    frame_budget = 1 / 60
+    
+    def __init__(self):
+        self._fd: Optional[int] = None
+        self._saved_mode = None
+        self._decoder = codecs.getincrementaldecoder("utf-8")("replace")
+    
+    def __enter__(self) -> "KeyReader":
+        if os.name != "nt" and sys.stdin.isatty():
+            try:
+                import termios
+                import tty
+                fd = sys.stdin.fileno()
+                self._saved_mode = termios.tcgetattr(fd)
+                tty.setcbreak(fd)
+                self._fd = fd
+            except Exception:
+                # Fall back to readchar, which sets the terminal mode per key
+                self._fd = None
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        if self._fd is not None:
+            import termios
+            termios.tcsetattr(self._fd, termios.TCSADRAIN, self._saved_mode)
+            self._fd = None
+    
+    def read(self) -> List[str]:
+        """Block for the next key press and return it with any keys that follow within the frame budget."""
+        import readchar
+        
+        if self._fd is not None:
+            return self._read_posix()
+        if os.name == "nt" and sys.stdin.isatty():
+            return self._read_windows()
+        return [readchar.readkey()]
+    
+    def _read_posix(self) -> List[str]:
+        select.select([self._fd], [], [])
+        data = os.read(self._fd, 4096)
+        if not data:
+            # Input closed; treat like Ctrl+C
+            raise KeyboardInterrupt
+        
+        deadline = time.monotonic() + self.frame_budget
+        while (remaining := deadline - time.monotonic()) > 0:
+            ready, _, _ = select.select([self._fd], [], [], remaining)
+            if not ready:
+                break
+            chunk = os.read(self._fd, 4096)
+            if not chunk:
+                break
+            data += chunk
+        
+        return self._split_keys(self._decoder.decode(data))
+    
+    def _read_windows(self) -> List[str]:
+        import msvcrt
+        
+        def read_key():
+            ch = msvcrt.getwch()
+            if ch in "\x00\xe0":
+                # Special keys arrive as two characters; readchar uses the 0x00 prefix for both
+                ch = "\x00" + msvcrt.getwch()
+            return ch
+        
+        keys = [read_key()]
+        deadline = time.monotonic() + self.frame_budget
+        while time.monotonic() < deadline:
+            if msvcrt.kbhit():
+                keys.append(read_key())
+            else:
+                time.sleep(0.001)
+        return keys
+    
+    @staticmethod
+    def _split_keys(text: str) -> List[str]:
+        """Split terminal input into keys, grouping escape sequences like readchar's POSIX readkey."""
+        keys = []
+        i = 0
+        while i < len(text):
+            start = i
+            i += 1
+            if text[start] == "\x1b":
+                # ESC [ or ESC O, then optional parameter characters, then the final character
+                for follow in ("\x4f\x5b", "\x31\x32\x33\x35\x36", "\x30\x31\x33\x34\x35\x37\x38\x39", None):
+                    if i >= len(text):
+                        break
+                    ch = text[i]
+                    i += 1
+                    if follow is not None and ch not in follow:
+                        break
+            keys.append(text[start:i])
+        return keys
+
+def _project_panel(project_info: Dict[str, str]) -> Panel:
+    """Build the project setup panel shown above the interactive selectors."""
+    from rich.panel import Panel
+    from rich.table import Table
+    
+    setup_table = Table(show_header=False, box=None, padding=(0, 1))
+    setup_table.add_column("Label", style="cyan", width=18)
+    setup_table.add_column("Path", style="white")
+    
+    setup_table.add_row("Project:", project_info["project_name"])
+    setup_table.add_row("Working Path:", project_info["working_directory"])
+    setup_table.add_row("Target Path:", project_info["target_directory"])
+    
+    return Panel(
+        setup_table,
+        title="[bold cyan]Project Setup[/bold cyan]",
+        border_style="cyan",
+        padding=(1, 2)
+    )
+
+def _selector_header(project_info: Optional[Dict[str, str]] = None, agent: Optional[str] = None) -> Group:
+    """Build the static part of a selector screen: banner, project and agent panels."""
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich.align import Align
+    
+    parts = [banner()]
+    
+    if project_info:
+        parts += [_project_panel(project_info), Text()]
+    
+    if agent:
+        # Show selected agent with border
+        agent_content = f"🤖 {agent} ({AGENT_CONFIG[agent]['name']})"
+        parts += [Panel(
+            Align.center(Text(agent_content, style="bold green")),
+            title="[bold cyan]Selected Agent[/bold cyan]",
+            border_style="green",
+            padding=(0, 1),
+            height=3
+        ), Text()]
+    
+    return Group(*parts)
+
+def _start_selector_screen(header: Group) -> None:
+    """Clear the screen and print the static header once; the selector body is drawn below it by Live."""
+    try:
+        console.clear()
+    except Exception:
+        # Fallback if clear doesn't work
+        console.print("\n" * 50)
+    console.print(header)
+
+def select_agent(project_info: Optional[Dict[str, str]] = None) -> Optional[str]:
+    """Interactive agent selection with keyboard navigation using table format."""
+    import readchar
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich.live import Live
+    from rich.table import Table
+    
+    agents = list(AGENT_CONFIG.keys())
+    selected_index = 0
+    
+    def render_agent_table():
+        """Render the agent table; the banner and project panel are printed once above it."""
+        # Create table
+        table = Table(show_header=False, box=None, padding=(0, 1))
+        table.add_column("Selector", style="cyan", width=3)
+        table.add_column("Agent", style="white", min_width=20)
+        table.add_column("Description", style="dim")
+        
+        # Add rows to table
+        for i, agent_key in enumerate(agents):
+            agent = AGENT_CONFIG[agent_key]
+            
+            if i == selected_index:
+                # Highlighted selection
+                selector = "▶"
+                agent_style = "bold cyan"
+                desc_style = "cyan"
+            else:
+                # Normal item
+                selector = " "
+                agent_style = "cyan"
+                desc_style = "dim"
+            
+            table.add_row(
+                Text(selector, style="cyan"),
+                Text(agent_key, style=agent_style),
+                Text(f"({agent['name']})", style=desc_style)
+            )
+        
+        # Wrap table in a panel with border
+        panel = Panel(
+            table,
+            title="[bold cyan]Choose your AI assistant:[/bold cyan]",
+            border_style="cyan",
+            padding=(1, 2)
+        )
+        
+        return Group(panel, Text(), Text("Use ↑/↓ to navigate, Enter to select, Esc to cancel", style="dim"))
+    
+    # Initial render
+    _start_selector_screen(_selector_header(project_info))
+    
+    with KeyReader() as reader, Live(render_agent_table(), console=get_console(), auto_refresh=False) as live:
+        while True:
+            try:
+                keys = reader.read()
+            except KeyboardInterrupt:
+                return None
+            except Exception:
+                # Handle any readchar exceptions gracefully; the screen is still redrawn
+                keys = []
+            
+            # Apply every key that arrived since the last frame, then redraw once
+            for key in keys:
+                try:
+                    if key == readchar.key.UP:
+                        selected_index = (selected_index - 1) % len(agents)
+                    elif key == readchar.key.DOWN:
+                        selected_index = (selected_index + 1) % len(agents)
+                    elif key == readchar.key.ENTER or key == '\r' or key == '\n':
+                        return agents[selected_index]
+                    elif key == readchar.key.ESC or key == '\x1b':
+                        return None
+                    elif key.lower() == 'q':
+                        return None
+                except KeyboardInterrupt:
+                    return None
+                except Exception:
+                    # Drop only the key that failed; the rest of the batch still applies
+                    continue
+            
+            try:
+                live.update(render_agent_table(), refresh=True)
+            except KeyboardInterrupt:
+                return None
+            except Exception:
+                # Keep reading keys so Esc still works if a frame fails to draw
+                pass
+
+class ServerSelector:
+    """Multi-select server list with search and pagination, shared by ``init`` and ``rm``.
+    
+    The banner, project and agent panels are printed once; only the search
+    box, the current page and the status line are redrawn in place through
+    ``rich.live.Live`` after a key changes the state.
+    
+    The list is virtualized: pages are sized to the terminal height, only the
+    visible rows are turned into renderables, and each entry's formatted
+    cells are computed once, so paging through a large catalog costs the
+    same as paging through a small one.
+    
+    Tab cycles the sort order. Orders come from a ``CatalogOrder`` built
+    with the selector, so switching is a lookup of a precomputed permutation
+    (or an integer sort of the current search matches).
+    """
+    
+    min_page_size = 5
+    # Lines used by the search box, panel borders and padding, and help text
+    chrome_height = 14
+    
+    def __init__(self, servers: List[Dict[str, Any]], agent: str, title: str, border_style: str = "cyan", selected_styles: Tuple[str, str] = ("bright_green", "green"), status_suffix: str = "", project_info: Optional[Dict[str, str]] = None):
+        self.servers = servers
+        self.agent = agent
+        self.title = title
+        self.border_style = border_style
+        self.selected_styles = selected_styles
+        self.status_suffix = status_suffix
+        self.project_info = project_info
+        
+        self.selected_indices = set()
+        # Bumped whenever the selection changes, so frames can be compared cheaply
+        self.selection_version = 0
+        self.current_index = 0
+        self.search_query = ""
+        self.server_filter = ServerFilter(servers)
+        self.server_order = CatalogOrder(servers)
+        # None keeps the list's own order: catalog or config order, or relevance while searching
+        self.sort_mode: Optional[str] = None
+        self.rows: List[int] = self.server_filter.indices
+        self._search_pending = False
+        self._cells: Dict[int, Tuple[str, str, str]] = {}
+    
+    @property
+    def items_per_page(self) -> int:
+        """Number of rows that fit below the static header in the current terminal."""
+        return max(self.min_page_size, console.size.height - self.chrome_height)
+    
+    @property
+    def current_page(self) -> int:
+        """Page holding the highlighted row."""
+        return self.current_index // self.items_per_page
+    
+    def filter_servers(self) -> None:
+        """Filter servers based on search query."""
+        self._search_pending = False
+        self.server_filter.set_query(self.search_query)
+        self.rows = self.server_order.sort(self.server_filter.indices, self.sort_mode)
+        
+        # Reset pagination and selection after filtering
+        self.current_index = 0
+    
+    def cycle_sort(self) -> None:
+        """Switch to the next sort order, returning to the default order after the last one."""
+        modes = (None,) + SORT_MODES
+        self.sort_mode = modes[(modes.index(self.sort_mode) + 1) % len(modes)]
+        self.rows = self.server_order.sort(self.server_filter.indices, self.sort_mode)
+        self.current_index = 0
+    
+    def sort_label(self) -> str:
+        """Name of the current order for the status line."""
+        if self.sort_mode:
+            return self.sort_mode
+        return "relevance" if self.search_query.strip() else "default"
+    
+    def get_total_pages(self) -> int:
+        """Calculate total number of pages."""
+        return (len(self.server_filter) + self.items_per_page - 1) // self.items_per_page
+    
+    def view_state(self) -> Tuple[Any, ...]:
+        """Everything the frame depends on; a batch of keys that leaves it unchanged needs no redraw.
+
+        The rows follow from the query and the sort order, so they are not compared.
+        """
+        return (self.search_query, self.sort_mode, self.current_index, self.selection_version, console.size)
+    
+    def get_original_index(self, filtered_index: int) -> int:
+        """Get the original server index from filtered index."""
+        return self.rows[filtered_index]
+    
+    def row_cells(self, original_index: int) -> Tuple[str, str, str]:
+        """Return the formatted name, author and stars cells for a server, computed once."""
+        cells = self._cells.get(original_index)
+        if cells is None:
+            server = self.servers[original_index]
+            
+            # Get by (author/organization) field with "By " prefix
+            by_org = str(server.get('by') or 'Unknown')
+            # Truncate long organization names to fit in column
+            if len(by_org) > 20:
+                by_org = by_org[:20] + "..."
+            by_text = f"By: {by_org}"
+            
+            # Get stargazer_count and format it with unfilled star icon
+            stars = server.get('stargazer_count') or 0
+            if stars >= 1000:
+                stars_text = f"☆ {stars/1000:.1f}k"
+            else:
+                stars_text = f"☆ {stars}"
+            
+            cells = self._cells[original_index] = (str(server.get('name') or ''), by_text, stars_text)
+        return cells
+    
+    def render_search(self) -> Panel:
+        """Render the search box."""
+        from rich.panel import Panel
+        from rich.text import Text
+        from rich.align import Align
+        
+        if self.search_query:
+            search_content = f"🔍 {self.search_query}"
+            search_style = "bold yellow"
+            border_style = "yellow"
+        else:
+            search_content = "🔍 (type to filter servers)"
+            search_style = "dim"
+            border_style = "dim"
+        
+        return Panel(
+            Align.center(Text(search_content, style=search_style)),
+            title="[bold cyan]Search[/bold cyan]" if self.search_query else "[dim]Search[/dim]",
+            border_style=border_style,
+            padding=(0, 1),
+            height=3
+        )
+    
+    def render_table(self) -> Panel:
+        """Render the current page of servers; rows outside it are never materialized."""
+        from rich.panel import Panel
+        from rich.text import Text
+        from rich.table import Table
+        
+        items_per_page = self.items_per_page
+        start_idx = self.current_index // items_per_page * items_per_page
+        end_idx = min(start_idx + items_per_page, len(self.server_filter))
+        total_pages = self.get_total_pages()
+        
+        # Create table
+        table = Table(show_header=False, box=None, padding=(0, 1))
+        table.add_column("Selector", style="cyan", width=3)
+        table.add_column("Checkbox", style="white", width=3)
+        table.add_column("Server", style="white", min_width=20)
+        table.add_column("By", style="dim", width=28)
+        table.add_column("Stars", style="dim", width=10)
+        
+        # Add rows to table for current page
+        for filtered_index in range(start_idx, end_idx):
+            original_index = self.get_original_index(filtered_index)
+            
+            if filtered_index == self.current_index:
+                # Highlighted selection
+                selector = "▶"
+                checkbox_style = "bold cyan"
+                server_style = "bold cyan"
+                desc_style = "cyan"
+            else:
+                # Normal item
+                selector = " "
+                if original_index in self.selected_indices:
+                    checkbox_style, desc_style = self.selected_styles
+                    server_style = checkbox_style
+                else:
+                    checkbox_style = "white"
+                    server_style = "white"
+                    desc_style = "dim"
+            
+            checkbox = "☑" if original_index in self.selected_indices else "☐"
+            name, by_text, stars_text = self.row_cells(original_index)
+            
+            table.add_row(
+                Text(selector, style="cyan"),
+                Text(checkbox, style=checkbox_style),
+                Text(name, style=server_style),
+                Text(by_text, style=desc_style),
+                Text(stars_text, style=desc_style)
+            )
+        
+        # Create status info for the panel subtitle
+        selected_count = len(self.selected_indices)
+        status_info = f"Selected: {selected_count} server{'s' if selected_count != 1 else ''}{self.status_suffix}"
+        
+        if total_pages > 1:
+            status_info += f" | Page {start_idx // items_per_page + 1} of {total_pages} | Showing {start_idx + 1}-{end_idx} of {len(self.server_filter)}"
+        
+        if self.search_query and len(self.server_filter) != len(self.servers):
+            status_info += f" | Filtered: {len(self.server_filter)}/{len(self.servers)}"
+        
+        status_info += f" | Sort: {self.sort_label()}"
+        
+        # Wrap table in a panel with border
+        return Panel(
+            table,
+            title=self.title,
+            subtitle=f"[bold yellow]{status_info}[/bold yellow]",
+            border_style=self.border_style,
+            padding=(1, 2)
+        )
+    
+    def render(self) -> Group:
+        """Render everything below the static header."""
+        from rich.console import Group
+        from rich.text import Text
+        
+        # Help text
+        help_lines = [
+            "Use ↑/↓ to navigate, Space to toggle, Enter to confirm, Esc to cancel",
+            "Type to search/filter servers, Backspace to delete search, Delete to clear search"
+        ]
+        
+        if self.get_total_pages() > 1:
+            help_lines.append("Use ←/→ or PgUp/PgDn to change pages")
+        
+        help_lines.append("Tab to change sort order (stars, name, org, updated), Ctrl+A=select all, Ctrl+N=select none")
+        
+        return Group(
+            self.render_search(),
+            Text(),
+            self.render_table(),
+            Text(),
+            *[Text(line, style="dim") for line in help_lines]
+        )
+    
+    @staticmethod
+    def is_search_edit(key: str) -> bool:
+        """Check whether a key only edits the search query."""
+        import readchar
+        
+        if key in (readchar.key.BACKSPACE, '\b', '\x7f', readchar.key.DELETE, readchar.key.SUPR):
+            return True
+        return len(key) == 1 and key.isprintable() and key != ' ' and key.lower() != 'q'
+    
+    def handle_key(self, key: str) -> Tuple[bool, Optional[List[int]]]:
+        """Apply a key press. Returns (done, result); result is None when cancelled.
+
+        Search edits only update the query; filtering is deferred until a key
+        that depends on the filtered list arrives or the batch is drawn.
+        """
+        import readchar
+        
+        if self._search_pending and not self.is_search_edit(key):
+            self.filter_servers()
+        
+        if key == readchar.key.UP:
+            # Wrap to last item from the first one
+            if self.server_filter:
+                self.current_index = (self.current_index - 1) % len(self.server_filter)
+        
+        elif key == readchar.key.DOWN:
+            # Wrap to first item from the last one
+            if self.server_filter:
+                self.current_index = (self.current_index + 1) % len(self.server_filter)
+        
+        elif key == readchar.key.LEFT or key == readchar.key.PAGE_UP:
+            if self.current_page > 0:
+                self.current_index = (self.current_page - 1) * self.items_per_page
+        
+        elif key == readchar.key.RIGHT or key == readchar.key.PAGE_DOWN:
+            if self.current_page < self.get_total_pages() - 1:
+                self.current_index = (self.current_page + 1) * self.items_per_page
+        
+        elif key == ' ':  # Space to toggle selection
+            if not self.rows:
+                # Nothing matches the search, so there is no row to toggle
+                return False, None
+            original_index = self.get_original_index(self.current_index)
+            if original_index in self.selected_indices:
+                self.selected_indices.remove(original_index)
+            else:
+                self.selected_indices.add(original_index)
+            self.selection_version += 1
+        
+        elif key == readchar.key.ENTER or key == '\r' or key == '\n':
+            if self.selected_indices:
+                return True, sorted(self.selected_indices)
+            if not self.rows:
+                # Nothing selected and nothing matches the search: keep the selector open
+                return False, None
+            # If nothing selected, select the current one
+            return True, [self.get_original_index(self.current_index)]
+        
+        elif key == readchar.key.ESC or key == '\x1b':
+            return True, None
+        
+        elif key.lower() == 'q':
+            return True, []
+        
+        elif key == '\x01':  # Ctrl+A to select all (filtered servers)
+            self.selected_indices.update(self.server_filter.indices)
+            self.selection_version += 1
+        
+        elif key == '\x0e':  # Ctrl+N to select none
+            self.selected_indices.clear()
+            self.selection_version += 1
+        
+        elif key == readchar.key.TAB or key == '\t':  # Tab to cycle the sort order
+            self.cycle_sort()
+        
+        elif key == readchar.key.BACKSPACE or key == '\b' or key == '\x7f':  # Backspace
+            if self.search_query:
+                self.search_query = self.search_query[:-1]
+                self._search_pending = True
+        
+        elif key == readchar.key.DELETE or key == readchar.key.SUPR:  # Delete key to clear search
+            if self.search_query:
+                self.search_query = ""
+                self._search_pending = True
+        
+        elif key == '\x03':  # Ctrl+C to exit
+            return True, None  # Return None to indicate cancellation
+        
+        elif len(key) == 1 and key.isprintable():  # Regular character input for search
+            self.search_query += key
+            self._search_pending = True
+        
+        return False, None
+    
+    def run(self) -> Optional[List[int]]:
+        """Run the selector and return the chosen original indices, [] on quit or None on cancel."""
+        from rich.live import Live
+        
+        _start_selector_screen(_selector_header(self.project_info, self.agent))
+        
+        with KeyReader() as reader, Live(self.render(), console=get_console(), auto_refresh=False) as live:
+            drawn = self.view_state()
+            while True:
+                try:
+                    keys = reader.read()
+                except KeyboardInterrupt:
+                    return None
+                except Exception:
+                    # Handle any readchar exceptions gracefully; the screen is still redrawn
+                    keys = []
+                
+                # Apply every key that arrived since the last frame, then filter and redraw once
+                for key in keys:
+                    try:
+                        done, result = self.handle_key(key)
+                    except KeyboardInterrupt:
+                        return None
+                    except Exception:
+                        # Drop only the key that failed; the rest of the batch still applies
+                        continue
+                    if done:
+                        return result
+                
+                try:
+                    if self._search_pending:
+                        self.filter_servers()
+                    # Keys that change nothing (arrows on an empty list, Backspace
+                    # on an empty query, ...) do not cost a frame
+                    if self.view_state() != drawn:
+                        live.update(self.render(), refresh=True)
+                        drawn = self.view_state()
+                except KeyboardInterrupt:
+                    return None
+                except Exception:
+                    # Keep reading keys so Esc still works if a frame fails to draw
+                    pass
+
+def select_servers_to_remove(configured_servers: List[str], metadata: Dict[str, Optional[Dict[str, Any]]], agent: str, project_info: Optional[Dict[str, str]] = None) -> Optional[List[str]]:
+    """Interactive server selection for removal with keyboard navigation, table format, and pagination."""
+    
+    # Match configured servers with available server data
+    matched_servers = match_configured_servers(configured_servers, metadata, agent)
+    
+    selector = ServerSelector(
+        matched_servers,
+        agent,
+        title="[bold red]Choose MCP servers to remove:[/bold red]",
+        border_style="red",
+        selected_styles=("bright_red", "red"),
+        status_suffix=" for removal",
+        project_info=project_info
+    )
+    selected = selector.run()
+    if selected is None:
+        return None
+    return [matched_servers[i]['configured_name'] for i in selected]
+
+def select_mcp_servers(servers: List[Dict[str, Any]], agent: str, project_info: Optional[Dict[str, str]] = None) -> Optional[List[Dict[str, Any]]]:
+    """Interactive MCP server selection with keyboard navigation, table format, pagination, and search filtering."""
+    selector = ServerSelector(
+        servers,
+        agent,
+        title="[bold cyan]Choose MCP servers to install:[/bold cyan]",
+        project_info=project_info
+    )
+    selected = selector.run()
+    if selected is None:
+        return None
+    return [servers[i] for i in selected]
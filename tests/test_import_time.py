@@ -0,0 +1,67 @@
+"""Startup cost of ``mcp_cli``, measured with ``python -X importtime``.
+
+Editor integrations run ``mcp`` for every lookup, so importing the package
+and running a headless command must not pull in the interactive or network
+stack, and the time spent importing has to stay within a fixed budget.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+# Modules that only the interactive UI or network code paths may import
+HEAVY_MODULES = {"rich", "httpx", "readchar", "truststore"}
+
+# Cumulative import time budgets in microseconds; importing every dependency
+# eagerly took about 260 ms
+IMPORT_BUDGET_US = 150_000
+HEADLESS_BUDGET_US = 250_000
+
+def _import_times(args, home):
+    """Run python -X importtime with args and return {module: cumulative microseconds}."""
+    env = dict(
+        os.environ,
+        HOME=str(home),
+        XDG_CACHE_HOME=str(home / "cache"),
+        XDG_CONFIG_HOME=str(home / "config"),
+        XDG_DATA_HOME=str(home / "data"),
+        PYTHONPATH=os.pathsep.join(filter(None, [str(SRC_DIR), os.environ.get("PYTHONPATH")])),
+    )
+    env.pop("PYTHONPROFILEIMPORTTIME", None)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=home, env=env, capture_output=True, text=True, timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.rstrip()] = int(cumulative)
+    return times
+
+def _top_level_total(times):
+    """Sum the cumulative time of modules imported directly rather than by another module."""
+    return sum(cumulative for name, cumulative in times.items() if not name.startswith(" "))
+
+def _heavy_modules(times):
+    return sorted({name.strip().split(".")[0] for name in times} & HEAVY_MODULES)
+
+@pytest.mark.parametrize("args, budget", [
+    (["-c", "import mcp_cli"], IMPORT_BUDGET_US),
+    (["-m", "mcp_cli", "list", "-a", "claude", "--json"], HEADLESS_BUDGET_US),
+    (["-m", "mcp_cli", "check", "--json"], HEADLESS_BUDGET_US),
+], ids=["import", "list-json", "check-json"])
+def test_startup_skips_heavy_modules(args, budget, tmp_path):
+    times = _import_times(args, tmp_path)
+    assert _heavy_modules(times) == []
+    # Take the fastest of a few runs so a busy machine does not fail the budget
+    total = min([_top_level_total(times)] + [_top_level_total(_import_times(args, tmp_path)) for _ in range(2)])
+    assert total <= budget, f"imports took {total / 1000:.0f} ms (budget {budget / 1000:.0f} ms)"
@@ -0,0 +1,47 @@
+"""Fuzzy search of the interactive server selectors."""
+
+import pytest
+
+from mcp_cli.catalog import load_bundled_mcp_servers
+from mcp_cli.index import ServerFilter
+
+@pytest.fixture(scope="module")
+def server_filter():
+    return ServerFilter(load_bundled_mcp_servers())
+
+def _names(server_filter, query):
+    server_filter.set_query(query)
+    return [server_filter.servers[index]["name"] for index in server_filter.indices]
+
+@pytest.mark.parametrize("query, expected", [
+    ("seq", ["SequentialThinking"]),
+    ("mem", ["Memory"]),
+    ("gti", ["Git"]),
+    ("igt", ["Git"]),
+    ("fecth", ["Fetch"]),
+    ("memroy", ["Memory"]),
+    ("thinkng", ["SequentialThinking"]),
+])
+def test_typos_find_the_server(server_filter, query, expected):
+    assert _names(server_filter, query) == expected
+
+@pytest.mark.parametrize("query", ["pely", "play", "seal"])
+def test_shared_first_and_last_letters_do_not_match(server_filter, query):
+    # "programmatically" and "search" share only padded trigrams, or one
+    # interior trigram, with these queries
+    assert _names(server_filter, query) == []
+
+def test_null_fields_are_searchable():
+    servers = [
+        {"name": "Xray", "description": None, "by": None, "mcp": {"a/xray": {}}},
+        {"name": "Yak", "mcp": {"b/yak": {}}},
+    ]
+    server_filter = ServerFilter(servers)
+    assert _names(server_filter, "xr") == ["Xray"]
+    assert _names(server_filter, "yak") == ["Yak"]
+    assert _names(server_filter, "none") == []
+
+def test_selector_rows_with_null_fields():
+    from mcp_cli.tui import ServerSelector
+    selector = ServerSelector([{"name": "Xray", "description": None, "by": None, "stargazer_count": None, "mcp": {"a/xray": {}}}], "claude", "title")
+    assert selector.row_cells(0) == ("Xray", "By: Unknown", "☆ 0")